@@ -0,0 +1,85 @@
+'''
+Benchmark measuring garbage collector pauses caused by tearing down large linked lists.
+
+Builds a DynamicList of `--size` elements, releases it by dropping the last reference, by
+calling `clear()`, or by dropping a list built with `weak_prev=True`, then forces a full
+collection. Pauses are timed through `gc.callbacks`, covering the collections triggered
+automatically while building as well. Run from the repository root with
+`python -m benchmarks.bench_gc`.
+'''
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, List
+import gc
+
+from src.linkeds import DynamicList
+
+
+class PauseRecorder:
+    '''Records the duration of every garbage collection while active.'''
+
+    def __init__(self) -> None:
+        self.pauses = []
+        self.collected = 0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == 'start':
+            self._start = perf_counter()
+        else:
+            self.pauses.append(perf_counter() - self._start)
+            self.collected += info['collected']
+
+    def __enter__(self) -> 'PauseRecorder':
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self)
+
+
+def drop(linked_list: DynamicList) -> None:
+    pass  # the caller drops the last reference right after
+
+
+def clear(linked_list: DynamicList) -> None:
+    linked_list.clear()
+
+
+def run(name: str, size: int, weak_prev: bool, release: Callable[[DynamicList], None]) -> None:
+    gc.collect()
+    with PauseRecorder() as recorder:
+        start = perf_counter()
+        linked_list = DynamicList(weak_prev=weak_prev)
+        for i in range(size):
+            linked_list.add_last(i)
+        build_seconds = perf_counter() - start
+
+        start = perf_counter()
+        release(linked_list)
+        del linked_list
+        release_seconds = perf_counter() - start
+
+        start = perf_counter()
+        gc.collect()
+        collect_seconds = perf_counter() - start
+
+    pauses: List[float] = recorder.pauses
+    print(f'{name:<10} build {build_seconds:>7.3f}s  release {release_seconds:>7.3f}s  '
+          f'full collect {collect_seconds * 1000:>8.1f}ms  pauses {len(pauses):>4}  '
+          f'max {max(pauses) * 1000:>8.1f}ms  total {sum(pauses) * 1000:>8.1f}ms  '
+          f'collected {recorder.collected:,}')
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=10 ** 6)
+    args = parser.parse_args()
+
+    run('drop', args.size, False, drop)
+    run('clear', args.size, False, clear)
+    run('weak_prev', args.size, True, drop)
+
+
+if __name__ == '__main__':
+    main()
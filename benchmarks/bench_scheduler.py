@@ -0,0 +1,90 @@
+'''
+Benchmark comparing WorkStealingScheduler throughput against pools fed by one shared queue.
+
+Each run executes the same number of small tasks: as a fork/join tree on the scheduler, as flat
+tasks on threads consuming a shared `queue.Queue`, and as flat tasks on a `ProcessPoolExecutor`.
+Run from the repository root with `python -m benchmarks.bench_scheduler`.
+'''
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from threading import Thread
+from time import perf_counter
+
+from src.linkeds import WorkStealingScheduler
+
+
+def work(n: int) -> int:
+    '''Small CPU-bound task.'''
+    return sum(range(n))
+
+
+def run_scheduler(tasks: int, grain: int, workers: int) -> float:
+    '''Returns the seconds taken to run a fork/join tree of `tasks` leaves on the scheduler.'''
+    with WorkStealingScheduler(workers) as scheduler:
+        def split(count: int) -> int:
+            if count == 1:
+                return work(grain)
+            left = scheduler.fork(split, count // 2)
+            right = split(count - count // 2)
+            return scheduler.join(left) + right
+
+        start = perf_counter()
+        scheduler.submit(split, tasks).result()
+        return perf_counter() - start
+
+
+def run_shared_queue(tasks: int, grain: int, workers: int) -> float:
+    '''Returns the seconds taken to run `tasks` tasks on threads sharing one `queue.Queue`.'''
+    queue = Queue()
+
+    def consume() -> None:
+        while True:
+            n = queue.get()
+            if n is None:
+                return
+            work(n)
+
+    threads = [Thread(target=consume) for _ in range(workers)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for _ in range(tasks):
+        queue.put(grain)
+    for _ in threads:
+        queue.put(None)
+    for thread in threads:
+        thread.join()
+    return perf_counter() - start
+
+
+def run_process_pool(tasks: int, grain: int, workers: int) -> float:
+    '''Returns the seconds taken to run `tasks` tasks on a process pool.'''
+    with ProcessPoolExecutor(workers) as executor:
+        start = perf_counter()
+        for _ in executor.map(work, [grain] * tasks, chunksize=max(1, tasks // (workers * 16))):
+            pass
+        return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=20_000)
+    parser.add_argument('--grain', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    runners = (
+        ('work-stealing threads', run_scheduler),
+        ('shared queue threads', run_shared_queue),
+        ('shared queue processes', run_process_pool),
+    )
+    print(f'{"runner":<24} {"workers":>8} {"tasks/s":>12}')
+    for workers in args.workers:
+        for name, runner in runners:
+            seconds = runner(args.tasks, args.grain, workers)
+            print(f'{name:<24} {workers:>8} {args.tasks / seconds:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
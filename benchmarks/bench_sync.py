@@ -0,0 +1,85 @@
+'''
+Threaded benchmark comparing ConcurrentList readers against a list guarded by a single mutex.
+
+On CPython with the GIL, only one reader runs Python code at a time, so the read lock cannot
+turn more reader threads into more throughput: both columns stay flat as readers are added,
+and the reader-writer lock pays for its extra bookkeeping. Its benefit is that readers never
+wait for one another while holding the lock, which matters when reads release the GIL or on
+free-threaded builds. Run from the repository root with `python -m benchmarks.bench_sync`.
+'''
+from argparse import ArgumentParser
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+
+from src.linkeds import ConcurrentList, DynamicList
+
+
+class MutexList:
+    '''Baseline wrapper serializing every call behind one mutex.'''
+
+    def __init__(self, linked_list: DynamicList) -> None:
+        self._list = linked_list
+        self._lock = Lock()
+
+    def get(self, index: int) -> object:
+        with self._lock:
+            return self._list.get(index)
+
+    def add_last(self, data: object) -> None:
+        with self._lock:
+            self._list.add_last(data)
+
+    def remove_last(self) -> object:
+        with self._lock:
+            return self._list.remove_last()
+
+
+def run(wrapper: object, readers: int, size: int, duration: float) -> float:
+    '''Returns the read throughput, in operations per second, of `readers` threads.'''
+    stop = Event()
+    counts = [0] * readers
+
+    def read(slot: int) -> None:
+        index = size // 2
+        while not stop.is_set():
+            for _ in range(100):
+                wrapper.get(index)
+            counts[slot] += 100
+
+    def write() -> None:
+        while not stop.is_set():
+            wrapper.add_last(None)
+            wrapper.remove_last()
+            sleep(0.001)
+
+    threads = [Thread(target=read, args=(slot,)) for slot in range(readers)]
+    threads.append(Thread(target=write))
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / (perf_counter() - start)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1_000)
+    parser.add_argument('--duration', type=float, default=1.0)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f'{"readers":>8} {"rwlock ops/s":>14} {"mutex ops/s":>14}')
+    for readers in args.threads:
+        results = []
+        for factory in (ConcurrentList, MutexList):
+            linked_list = DynamicList()
+            linked_list.assign_iterable(list(range(args.size)))
+            results.append(run(factory(linked_list), readers, args.size, args.duration))
+        print(f'{readers:>8} {results[0]:>14,.0f} {results[1]:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+'''
+Benchmark comparing TimingWheel against a `heapq` scheduler with lazy cancellation.
+
+Schedules `--timers` timeouts, cancels most of them, then advances until every remaining one
+expires. Run from the repository root with `python -m benchmarks.bench_timing`.
+'''
+from argparse import ArgumentParser
+from heapq import heappop, heappush
+from random import Random
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from src.linkeds import TimingWheel
+
+
+class HeapScheduler:
+    '''Baseline scheduler keeping [deadline, sequence, item, active] entries in a heap.'''
+
+    def __init__(self) -> None:
+        self._heap = []
+        self._sequence = 0
+
+    def schedule(self, deadline: float, item: object) -> list:
+        entry = [deadline, self._sequence, item, True]
+        self._sequence += 1
+        heappush(self._heap, entry)
+        return entry
+
+    @staticmethod
+    def cancel(entry: list) -> None:
+        entry[3] = False
+
+    def advance(self, now: float) -> List[object]:
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heappop(self._heap)
+            if entry[3]:
+                expired.append(entry[2])
+        return expired
+
+
+def timed(function: Callable[[], object]) -> Tuple[float, object]:
+    start = perf_counter()
+    result = function()
+    return perf_counter() - start, result
+
+
+def run(name: str, schedule: Callable, cancel: Callable, advance: Callable,
+        delays: List[float], cancelled: List[int], horizon: float, step: float) -> None:
+    schedule_seconds, handles = timed(lambda: [schedule(delay, i) for i, delay in enumerate(delays)])
+    cancel_seconds, _ = timed(lambda: [cancel(handles[i]) for i in cancelled])
+
+    def drain() -> int:
+        count, now = 0, 0.0
+        while now < horizon:
+            now += step
+            count += len(advance(now))
+        return count
+
+    advance_seconds, expired = timed(drain)
+    print(f'{name:<12} schedule {schedule_seconds:>7.3f}s  cancel {cancel_seconds:>7.3f}s  '
+          f'advance {advance_seconds:>7.3f}s  expired {expired:,}')
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--timers', type=int, default=10 ** 6)
+    parser.add_argument('--cancel-ratio', type=float, default=0.9)
+    parser.add_argument('--horizon', type=float, default=60.0, help='longest timeout, in seconds')
+    parser.add_argument('--step', type=float, default=0.01, help='interval between advances')
+    args = parser.parse_args()
+
+    random = Random(0)
+    delays = [random.uniform(0, args.horizon) for _ in range(args.timers)]
+    cancelled = random.sample(range(args.timers), int(args.timers * args.cancel_ratio))
+
+    wheel = TimingWheel(tick=args.step)
+    run('TimingWheel', wheel.schedule, wheel.cancel, wheel.advance,
+        delays, cancelled, args.horizon, args.step)
+
+    heap = HeapScheduler()
+    run('heapq', heap.schedule, heap.cancel, heap.advance, delays, cancelled, args.horizon, args.step)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+'''
+Benchmark suite covering every public operation of the bounded and dynamic structures.
+
+For each structure, operation and size it measures throughput and latency percentiles, the
+memory per element reported by `tracemalloc`, and the JSON round-trip of the lists. Results are
+saved as JSON and compared against a stored baseline, flagging throughput regressions.
+
+Run from the repository root, for example:
+
+    python -m benchmarks.run --sizes 100 10000 --save-baseline
+    python -m benchmarks.run --sizes 100 10000 --output results.json
+'''
+from argparse import ArgumentParser
+from os import path
+from platform import python_version
+from time import perf_counter, perf_counter_ns
+from typing import Callable, Dict, List
+import json
+import sys
+import tracemalloc
+
+from src.linkeds import (
+    BoundedList, DynamicList,
+    BoundedQueue, DynamicQueue,
+    BoundedStack, DynamicStack
+)
+
+
+DEFAULT_SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5)
+DEFAULT_BASELINE = path.join(path.dirname(__file__), 'baseline.json')
+MAX_REPEAT = 1_000
+
+LIST_OPERATIONS = {
+    'add_first': lambda lst: lst.add_first(0),
+    'add_last': lambda lst: lst.add_last(0),
+    'insert': lambda lst: lst.insert(lst.size // 2, 0),
+    'get_first': lambda lst: lst.get_first(),
+    'get_last': lambda lst: lst.get_last(),
+    'get': lambda lst: lst.get(lst.size // 2),
+    'remove_first': lambda lst: lst.remove_first(),
+    'remove_last': lambda lst: lst.remove_last(),
+    'remove': lambda lst: lst.remove(lst.size // 2),
+}
+QUEUE_OPERATIONS = {
+    'enqueue': lambda queue: queue.enqueue(0),
+    'dequeue': lambda queue: queue.dequeue(),
+    'peek': lambda queue: queue.peek(),
+}
+STACK_OPERATIONS = {
+    'push': lambda stack: stack.push(0),
+    'pop': lambda stack: stack.pop(),
+    'peek': lambda stack: stack.peek(),
+}
+STRUCTURES = {
+    'BoundedList': (lambda capacity: BoundedList(capacity), 'add_last', LIST_OPERATIONS),
+    'DynamicList': (lambda capacity: DynamicList(), 'add_last', LIST_OPERATIONS),
+    'BoundedQueue': (lambda capacity: BoundedQueue(capacity), 'enqueue', QUEUE_OPERATIONS),
+    'DynamicQueue': (lambda capacity: DynamicQueue(), 'enqueue', QUEUE_OPERATIONS),
+    'BoundedStack': (lambda capacity: BoundedStack(capacity), 'push', STACK_OPERATIONS),
+    'DynamicStack': (lambda capacity: DynamicStack(), 'push', STACK_OPERATIONS),
+}
+
+
+def build(structure: str, size: int, spare: int) -> object:
+    '''Builds a structure holding `size` elements with room for `spare` more.'''
+    factory, add, _ = STRUCTURES[structure]
+    instance = factory(size + spare)
+    add = getattr(instance, add)
+    for i in range(size):
+        add(i)
+    return instance
+
+
+def percentile(samples: List[int], fraction: float) -> float:
+    '''Returns a percentile of sorted samples, in microseconds.'''
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))] / 1_000
+
+
+def bench_operation(structure: str, operation: Callable, size: int) -> Dict[str, float]:
+    '''Measures throughput and latency percentiles of an operation on a structure of a size.'''
+    repeat = min(size, MAX_REPEAT)
+    instance = build(structure, size, repeat)
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        operation(instance)
+        samples.append(perf_counter_ns() - start)
+    samples.sort()
+    return {
+        'ops_per_sec': repeat / (sum(samples) / 1e9 or 1e-9),
+        'p50_us': percentile(samples, 0.50),
+        'p90_us': percentile(samples, 0.90),
+        'p99_us': percentile(samples, 0.99),
+    }
+
+
+def bench_memory(structure: str, size: int) -> float:
+    '''Returns the bytes allocated per element while building a structure.'''
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instance = build(structure, size, 0)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instance
+    return (after - before) / size
+
+
+def bench_json(structure: str, size: int) -> Dict[str, float]:
+    '''Measures a JSON round-trip of a list structure.'''
+    instance = build(structure, size, 0)
+    start = perf_counter()
+    json_str = instance.dumps_json()
+    dumps_seconds = perf_counter() - start
+    start = perf_counter()
+    instance.loads_json(json_str)
+    loads_seconds = perf_counter() - start
+    return {'bytes': len(json_str), 'dumps_seconds': dumps_seconds, 'loads_seconds': loads_seconds}
+
+
+def run(sizes: List[int], structures: List[str]) -> Dict[str, object]:
+    '''Runs the suite and returns its results.'''
+    results = {}
+    for structure in structures:
+        operations = STRUCTURES[structure][2]
+        for size in sizes:
+            key = f'{structure}[{size}]'
+            entry = results[key] = {'operations': {}, 'bytes_per_element': bench_memory(structure, size)}
+            for name, operation in operations.items():
+                entry['operations'][name] = bench_operation(structure, operation, size)
+            if structure.endswith('List'):
+                entry['json'] = bench_json(structure, size)
+            print(f'{key:<24} {entry["bytes_per_element"]:>8.1f} B/element', file=sys.stderr)
+    return {'python': python_version(), 'results': results}
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    '''Returns a description of every operation whose throughput dropped beyond the threshold.'''
+    regressions = []
+    for key, entry in current['results'].items():
+        baseline_entry = baseline['results'].get(key)
+        if baseline_entry is None:
+            continue
+        for name, stats in entry['operations'].items():
+            baseline_stats = baseline_entry['operations'].get(name)
+            if baseline_stats is None:
+                continue
+            ratio = stats['ops_per_sec'] / baseline_stats['ops_per_sec']
+            if ratio < 1 - threshold:
+                regressions.append(f'{key}.{name}: {ratio:.0%} of baseline throughput')
+    return regressions
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--structures', nargs='+', choices=list(STRUCTURES), default=list(STRUCTURES))
+    parser.add_argument('--output', help='file to save the results to')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as baseline')
+    parser.add_argument('--threshold', type=float, default=0.10, help='tolerated throughput drop')
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.structures)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(current, output_file, indent=4)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(current, baseline_file, indent=4)
+        return
+
+    if not path.exists(args.baseline):
+        print(f'No baseline at {args.baseline}; run with --save-baseline to store one.')
+        return
+    with open(args.baseline) as baseline_file:
+        regressions = compare(current, json.load(baseline_file), args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    if regressions:
+        sys.exit(1)
+    print('No regressions against baseline.')
+
+
+if __name__ == '__main__':
+    main()
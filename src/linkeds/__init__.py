@@ -1,23 +1,88 @@
-from .jsonifier import (
-    InvalidJson,
-    Jsonifier
-)
-from .list import (
-    EmptyList, FullList, IndexListError, InvalidIterableAssignment,
-    LinkedList,
-    BoundedList, DynamicList
-)
-from .node import (
-    Node,
-    DoubleNode, SingleNode
-)
-from .queue import (
-    EmptyQueue, FullQueue,
-    LinkedQueue,
-    BoundedQueue, DynamicQueue
-)
-from .stack import (
-    EmptyStack, FullStack,
-    LinkedStack,
-    BoundedStack, DynamicStack
-)
+'''
+Linked data structures.
+
+Submodules are imported lazily (PEP 562) the first time one of their names is accessed, so a
+worker that only needs `DynamicStack` does not pay for JSON support or the list machinery.
+'''
+_EXPORTS = {
+    'consumer': (
+        'BatchConsumer', 'TokenBucket',
+    ),
+    'expiring': (
+        'ExpiringQueue',
+    ),
+    'jsonifier': (
+        'InvalidJson',
+        'Jsonifier',
+    ),
+    'list': (
+        'ConcurrentListModification', 'EmptyList', 'FullList', 'IndexListError', 'InvalidIterableAssignment',
+        'LinkedList',
+        'BoundedList', 'DynamicList',
+    ),
+    'metrics': (
+        'Exporter',
+        'CallbackExporter', 'Metrics',
+        'instrument', 'is_instrumented', 'uninstrument',
+    ),
+    'node': (
+        'Node',
+        'DoubleNode', 'SingleNode', 'WeakDoubleNode',
+    ),
+    'numeric': (
+        'InvalidNumericFile',
+        'NumericList',
+    ),
+    'persistent': (
+        'PersistentList', 'PersistentStack',
+    ),
+    'queue': (
+        'ConcurrentQueueModification', 'EmptyQueue', 'FullQueue',
+        'LinkedQueue',
+        'BoundedQueue', 'DynamicQueue',
+    ),
+    'scheduler': (
+        'EmptyDeque',
+        'WorkStealingDeque', 'WorkStealingScheduler',
+    ),
+    'spill': (
+        'SpillingQueue',
+    ),
+    'stack': (
+        'ConcurrentStackModification', 'EmptyStack', 'FullStack',
+        'LinkedStack',
+        'BoundedStack', 'DynamicStack',
+    ),
+    'sync': (
+        'ReadWriteLock',
+        'ConcurrentList',
+    ),
+    'timing': (
+        'TimerHandle',
+        'TimingWheel',
+    ),
+    'wal': (
+        'InvalidFsyncPolicy',
+        'WriteAheadLog', 'DurableStructure',
+        'recover',
+    ),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str) -> object:
+    '''Imports the submodule defining a public name on first access.'''
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(__import__(module, globals(), level=1, fromlist=(name,)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    '''Lists the public names alongside the module attributes.'''
+    return sorted(set(globals()) | set(__all__))
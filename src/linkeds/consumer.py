@@ -0,0 +1,170 @@
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Callable, Dict, List
+import asyncio
+import inspect
+
+from .queue import LinkedQueue
+
+
+class TokenBucket:
+    '''
+    Class representing a token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Consuming more tokens than
+    available borrows against the refill and returns how long the caller should wait.
+    '''
+
+    def __init__(self, rate: float, capacity: float = None, clock: Callable[[], float] = monotonic) -> None:
+        '''
+        Initializes a full token bucket.
+
+        Parameters:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum tokens stored, the rate by default (one second of burst).
+            clock (Callable): Function returning the current time in seconds.
+        '''
+        self._rate = rate
+        self._capacity = rate if (capacity is None) else capacity
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+
+    def consume(self, tokens: float = 1) -> float:
+        '''Takes tokens from the bucket and returns the seconds to wait before using them.'''
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= tokens
+        return -self._tokens / self._rate if (self._tokens < 0) else 0.0
+
+
+class BatchConsumer:
+    '''
+    Class representing a consumer that drains a linked queue in micro-batches.
+
+    A batch is handed to the sink once it holds `max_batch` items or `max_wait` seconds have
+    passed since collection started, whichever comes first. An optional token bucket limits the
+    number of items delivered per second. Batches can be consumed from a thread or a coroutine.
+    '''
+
+    def __init__(
+        self, queue: LinkedQueue, sink: Callable[[List[object]], object], max_batch: int = 100,
+        max_wait: float = 0.05, rate_limiter: TokenBucket = None, lock: Lock = None,
+        poll_interval: float = 0.001, clock: Callable[[], float] = monotonic
+    ) -> None:
+        '''
+        Initializes a batch consumer.
+
+        Parameters:
+            queue (LinkedQueue): Queue to drain.
+            sink (Callable): Function, or coroutine function in asyncio mode, receiving each batch.
+            max_batch (int): Maximum number of items per batch.
+            max_wait (float): Maximum seconds spent collecting a batch.
+            rate_limiter (TokenBucket): Optional limiter charged one token per item.
+            lock (Lock): Lock shared with the producers, if they run in other threads.
+            poll_interval (float): Seconds to sleep while the queue is empty.
+            clock (Callable): Function returning the current time in seconds.
+
+        Raises:
+            ValueError: If the maximum batch size is lower than one.
+        '''
+        if max_batch < 1:
+            raise ValueError('max_batch must be at least 1')
+
+        self._queue = queue
+        self._sink = sink
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._rate_limiter = rate_limiter
+        self._lock = lock
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._batch_sizes = {}
+        self._stop = Event()
+        self._thread = None
+
+    def _collect(self, batch: List[object]) -> bool:
+        '''Internal method to drain ready items into a batch, returning True once it is full.'''
+        count = self._max_batch - len(batch)
+        if self._lock is None:
+            batch.extend(self._queue.drain(count))
+        else:
+            with self._lock:
+                batch.extend(self._queue.drain(count))
+        return len(batch) >= self._max_batch
+
+    def _record(self, batch: List[object]) -> float:
+        '''Internal method to record a batch size and return the delay imposed by the rate limit.'''
+        self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+        return self._rate_limiter.consume(len(batch)) if (self._rate_limiter is not None) else 0.0
+
+    def next_batch(self) -> List[object]:
+        '''Collects the next batch, blocking for at most `max_wait` seconds.'''
+        deadline = self._clock() + self._max_wait
+        batch = []
+        while not self._collect(batch) and self._clock() < deadline:
+            sleep(self._poll_interval)
+        return batch
+
+    async def next_batch_async(self) -> List[object]:
+        '''Collects the next batch, awaiting for at most `max_wait` seconds.'''
+        deadline = self._clock() + self._max_wait
+        batch = []
+        while not self._collect(batch) and self._clock() < deadline:
+            await asyncio.sleep(self._poll_interval)
+        return batch
+
+    def run_once(self) -> int:
+        '''Collects a batch and delivers it to the sink, returning its size.'''
+        batch = self.next_batch()
+        if batch:
+            sleep(self._record(batch))
+            self._sink(batch)
+        return len(batch)
+
+    async def run_once_async(self) -> int:
+        '''Collects a batch and delivers it to the sink without blocking the loop.'''
+        batch = await self.next_batch_async()
+        if batch:
+            await asyncio.sleep(self._record(batch))
+            result = self._sink(batch)
+            if inspect.isawaitable(result):
+                await result
+        return len(batch)
+
+    def run(self) -> None:
+        '''Delivers batches until `stop` is called, then flushes the items left in the queue.'''
+        while not self._stop.is_set():
+            self.run_once()
+        while self.run_once():
+            pass
+
+    async def run_async(self) -> None:
+        '''Delivers batches until `stop` is called, then flushes the items left in the queue.'''
+        while not self._stop.is_set():
+            await self.run_once_async()
+        while await self.run_once_async():
+            pass
+
+    def start(self) -> Thread:
+        '''Starts delivering batches from a daemon thread and returns it.'''
+        self._stop.clear()
+        self._thread = Thread(target=self.run, name='linkeds-batch-consumer', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        '''Asks the consumer to stop, waiting for its thread if it was started.'''
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> Dict[str, object]:
+        '''Returns the number of batches and items delivered and the batch size distribution.'''
+        return {
+            'batches': sum(self._batch_sizes.values()),
+            'items': sum(size * count for size, count in self._batch_sizes.items()),
+            'batch_sizes': dict(sorted(self._batch_sizes.items())),
+        }
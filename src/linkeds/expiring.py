@@ -0,0 +1,146 @@
+from heapq import heappop, heappush
+from time import monotonic
+from typing import Callable, Iterator, List
+
+from .queue import EmptyQueue, LinkedQueue
+
+
+class ExpiringQueue(LinkedQueue):
+    '''
+    Class representing a dynamic queue whose items expire after a time-to-live.
+
+    Expired items are dropped lazily when they reach the front, at `dequeue` or `peek`. With a
+    single TTL the deadlines grow with the enqueue order, so every expired item sits at the
+    front and dropping it is amortized O(1); an item with a shorter TTL behind a live one is
+    dropped when it reaches the front. Delayed items wait in a heap until they become ready.
+    '''
+
+    def __init__(self, ttl: float = None, clock: Callable[[], float] = monotonic) -> None:
+        '''
+        Initializes an empty expiring queue.
+
+        Parameters:
+            ttl (float): Default time-to-live of the items in seconds, None to never expire.
+            clock (Callable): Function returning the current time in seconds.
+        '''
+        super().__init__()
+        self._ttl = ttl
+        self._clock = clock
+        self._delayed = []
+        self._sequence = 0
+        self._expired = 0
+
+    @property
+    def expired(self) -> int:
+        '''Getter method for the number of items dropped after expiring.'''
+        return self._expired
+
+    @property
+    def delayed(self) -> int:
+        '''Getter method for the number of items waiting for their delay.'''
+        return len(self._delayed)
+
+    def enqueue(self, data: object, ttl: float = None, delay: float = None) -> None:
+        '''
+        Enqueues data into the queue.
+
+        Parameters:
+            data (object): Item to enqueue.
+            ttl (float): Time-to-live in seconds, counted once the item is ready; the queue
+                default when None.
+            delay (float): Seconds to wait before the item can be dequeued.
+        '''
+        ready_at = self._clock() + (delay or 0)
+        ttl = self._ttl if (ttl is None) else ttl
+        deadline = None if (ttl is None) else ready_at + ttl
+        if delay:
+            heappush(self._delayed, (ready_at, self._sequence, deadline, data))
+            self._sequence += 1
+        else:
+            self._enqueue((deadline, data))
+
+    def _release(self, now: float) -> None:
+        '''Internal method to move delayed items that became ready to the rear of the queue.'''
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, deadline, data = heappop(self._delayed)
+            self._enqueue((deadline, data))
+
+    def _discard_expired(self, now: float) -> None:
+        '''Internal method to drop the expired items at the front of the queue.'''
+        while self._front is not None:
+            deadline = self._front.data[0]
+            if deadline is None or deadline > now:
+                break
+            super().dequeue()
+            self._expired += 1
+
+    def clear(self) -> None:
+        '''Removes every item, including the delayed ones.'''
+        super().clear()
+        self._delayed = []
+
+    def purge(self) -> None:
+        '''Releases ready delayed items and drops the expired items at the front.'''
+        now = self._clock()
+        self._release(now)
+        self._discard_expired(now)
+
+    def dequeue(self) -> object:
+        '''
+        Removes and returns the oldest item that has not expired.
+
+        Raises:
+            EmptyQueue: If no ready item is left.
+        '''
+        self.purge()
+        if self.is_empty():
+            raise EmptyQueue()
+
+        return super().dequeue()[1]
+
+    def drain(self, count: int = None) -> List[object]:
+        '''
+        Removes and returns up to `count` items that have not expired.
+
+        The clock is read once, so items expiring while the batch is collected are still
+        returned instead of cutting the batch short.
+
+        Returns:
+            list: Removed items in FIFO order, all ready ones if count is None.
+
+        Raises:
+            ValueError: If the count is negative.
+        '''
+        if count is not None and count < 0:
+            raise ValueError('count must not be negative')
+
+        now = self._clock()
+        self._release(now)
+        items = []
+        while count is None or len(items) < count:
+            self._discard_expired(now)
+            if self.is_empty():
+                break
+            items.append(super().dequeue()[1])
+        return items
+
+    def peek(self) -> object:
+        '''
+        Returns the oldest item that has not expired without removing it.
+
+        Returns:
+            object: Data of the front item, or None if no ready item is left.
+        '''
+        self.purge()
+        return self._front.data[1] if (self._front is not None) else self._front
+
+    def snapshot_iter(self) -> Iterator[object]:
+        '''Returns an iterator over the ready items, unaffected by later changes.'''
+        self.purge()
+        return (data for _, data in super().snapshot_iter())
+
+    def __iter__(self) -> Iterator[object]:
+        '''Iterator method to allow iterating through the ready items from front to rear.'''
+        self.purge()
+        for _, data in super().__iter__():
+            yield data
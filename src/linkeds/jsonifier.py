@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
-from os import path, getcwd
+from importlib import import_module
+from io import TextIOWrapper
+from os import chmod, fdopen, fsync, getcwd, path, remove, replace, stat, umask
+from tempfile import mkstemp
+from time import perf_counter
+from typing import Dict, Tuple
 import json
 
 
+UMASK = umask(0)
+umask(UMASK)
+
+
 class InvalidJson(Exception):
     '''Exception raised for invalid JSON.'''
 
@@ -13,13 +22,29 @@ class InvalidJson(Exception):
 class Jsonifier(ABC):
     '''
     Abstract base class for handling JSON data.
+
+    Files ending in `.gz` or `.xz` are compressed with `gzip` or `lzma`. Files are written to a
+    temporary file first and then replace the target atomically, so a crash never leaves a
+    partial dump behind.
     '''
 
     JSON_INDENT = 4
+    JSON_COMPACT_SEPARATORS = (',', ':')
+    COMPRESSIONS = {'.gz': 'gzip', '.xz': 'lzma'}
+    BUFFER_SIZE = 1 << 20
+    FILE_MODE = 0o666 & ~UMASK
+
+    def _compression(self, file_path: str) -> object:
+        '''Returns the compression module matching the file extension, or None.'''
+        module = self.COMPRESSIONS.get(path.splitext(file_path)[1])
+        return None if (module is None) else import_module(module)
 
     def _read_json_file(self, file_path: str, encoding: str) -> object:
-        '''Reads JSON data from a file.'''
-        with open(file_path, 'r', encoding=encoding) as json_file:
+        '''Reads JSON data from a file, decompressing it if needed.'''
+        file_path = self._generate_file_path(file_path)
+        compression = self._compression(file_path)
+        opener = open if (compression is None) else compression.open
+        with opener(file_path, 'rt', encoding=encoding) as json_file:
             data = json.load(json_file)
         return data
 
@@ -38,24 +63,61 @@ class Jsonifier(ABC):
         ...
 
     def _generate_file_path(self, file_path: str) -> str:
-        '''Generates a valid file path for writing JSON data.'''
-        if not (file_path and file_path.endswith('.json')):
+        '''Generates the default file path in the current directory when none is given.'''
+        if not file_path:
             file_path = path.join(getcwd(), f'{self.__class__.__name__}.json')
         return file_path
 
-    def _write_json_file(self, data: object, file_path: str, indent: int, encoding: str) -> None:
-        '''Writes JSON data to a file.'''
-        with open(self._generate_file_path(file_path), 'w', encoding=encoding) as json_file:
-            json.dump(data, json_file, indent=indent)
+    def _write_json_file(
+        self, data: object, file_path: str, indent: int, encoding: str, separators: Tuple[str, str] = None
+    ) -> Dict[str, float]:
+        '''
+        Writes JSON data to a file atomically, compressing it if needed.
+
+        The data goes to a uniquely named temporary file in the same folder, so concurrent dumps
+        to the same target never share it. The target keeps its permissions, and new files get
+        `FILE_MODE`, the default mode for new files under the process umask read at import.
+
+        Returns:
+            dict: Size of the written file in `bytes` and duration of the dump in `seconds`.
+        '''
+        start = perf_counter()
+        file_path = self._generate_file_path(file_path)
+        compression = self._compression(file_path)
+        mode = stat(file_path).st_mode & 0o777 if path.exists(file_path) else self.FILE_MODE
+        descriptor, temp_path = mkstemp(prefix=f'.{path.basename(file_path)}.', dir=path.dirname(file_path) or None)
+        try:
+            chmod(temp_path, mode)
+            with fdopen(descriptor, 'wb', buffering=self.BUFFER_SIZE) as raw_file:
+                stream = raw_file if (compression is None) else compression.open(raw_file, 'wb')
+                try:
+                    json_file = TextIOWrapper(stream, encoding=encoding)
+                    json.dump(data, json_file, indent=indent, separators=separators)
+                    json_file.flush()
+                    json_file.detach()
+                finally:
+                    if stream is not raw_file:
+                        stream.close()
+                raw_file.flush()
+                fsync(raw_file.fileno())
+            replace(temp_path, file_path)
+        except BaseException:
+            if path.exists(temp_path):
+                remove(temp_path)
+            raise
+        return {'bytes': path.getsize(file_path), 'seconds': perf_counter() - start}
 
     @abstractmethod
-    def dump_json(self, file_path: str = None, indent: int = JSON_INDENT, encoding: str = None) -> None:
-        '''Abstract method to dump JSON data to a file.'''
+    def dump_json(
+        self, file_path: str = None, indent: int = JSON_INDENT, encoding: str = None,
+        separators: Tuple[str, str] = None
+    ) -> Dict[str, float]:
+        '''Abstract method to dump JSON data to a file, returning its size and duration.'''
         ...
 
-    def _write_json_str(self, data: object, indent: int = JSON_INDENT) -> str:
+    def _write_json_str(self, data: object, indent: int = JSON_INDENT, separators: Tuple[str, str] = None) -> str:
         '''Converts JSON data to a formatted string.'''
-        return json.dumps(data, indent=indent)
+        return json.dumps(data, indent=indent, separators=separators)
 
     @abstractmethod
     def dumps_json(self) -> str:
@@ -1,8 +1,9 @@
-from abc import ABC, abstractmethod
-from typing import Iterator, List, Tuple, Set, Union
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Tuple, Set, Union
 
 from .jsonifier import Jsonifier
-from .node import DoubleNode
+from .node import DoubleNode, WeakDoubleNode
 
 
 class EmptyList(Exception):
@@ -33,15 +34,34 @@ class InvalidIterableAssignment(Exception):
         super().__init__(message)
 
 
-class LinkedList(ABC):
-    '''Abstract base class for a linked list.'''
+class ConcurrentListModification(RuntimeError):
+    '''Exception raised when a linked list is structurally modified while being iterated.'''
+
+    def __init__(self, message: str = 'List changed during iteration') -> None:
+        super().__init__(message)
+
+
+class LinkedList(Sequence):
+    '''
+    Abstract base class for a linked list.
+
+    Implements the `collections.abc.Sequence` protocol plus item and slice assignment, `del`,
+    `append`, `extend`, `pop` and `+=`, so most code written for Python lists works unchanged.
+    It is not registered as a `MutableSequence`, because `remove` takes an index and `reverse`
+    returns a new list. Lists compare by value, so like Python lists they are not hashable.
+
+    With `weak_prev`, nodes refer to their predecessor through a weak reference, so the chain
+    holds no reference cycles and is freed by reference counting alone when the list is dropped.
+    '''
 
     ASSIGNABLE_ITERABLE_TYPES = (list, tuple, set)
 
-    def __init__(self) -> None:
-        '''Initializes an empty linked list.'''
+    def __init__(self, weak_prev: bool = False) -> None:
+        '''Initializes an empty linked list, optionally with weak references to previous nodes.'''
         self._head = self._tail = None
         self._size = 0
+        self._version = 0
+        self._node_class = WeakDoubleNode if weak_prev else DoubleNode
 
     @property
     def size(self) -> int:
@@ -52,9 +72,86 @@ class LinkedList(ABC):
         '''Checks if the list is empty.'''
         return self._size == 0
     
+    def _new_instance(self) -> 'LinkedList':
+        '''Internal method to create an empty list configured like this one.'''
+        return self.__class__(weak_prev=self._node_class is WeakDoubleNode)
+
+    def _ensure_capacity(self, count: int) -> None:
+        '''Internal method to check that `count` more elements fit in the list.'''
+
+    def _normalize_index(self, index: int) -> int:
+        '''
+        Internal method to convert a possibly negative index into a position in the list.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexListError()
+        return index
+
+    def _node_at(self, index: int) -> DoubleNode:
+        '''Internal method to return the node at a valid position, walking from the nearest end.'''
+        if index <= self._size // 2:
+            node = self._head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self._size - 1 - index):
+                node = node.prev
+        return node
+
+    def _slice_nodes(self, index: slice) -> Iterator[DoubleNode]:
+        '''
+        Internal method to yield the nodes selected by a slice with a single positional seek.
+
+        The walk only relies on the links of nodes it has already yielded, so callers may unlink
+        each node as it is produced.
+        '''
+        positions = range(*index.indices(self._size))
+        if not positions:
+            return
+
+        step = positions.step
+        node = self._node_at(positions[0])
+        yield node
+        for _ in range(len(positions) - 1):
+            for _ in range(abs(step)):
+                node = node.next if (step > 0) else node.prev
+            yield node
+
+    def _link_before(self, node: DoubleNode, data: object) -> None:
+        '''Internal method to link a new node with the given data before a node of the list.'''
+        if node is None:
+            self._add_last(data)
+        elif node is self._head:
+            self._add_first(data)
+        else:
+            new_node = self._node_class(data, node.prev, node)
+            node.prev.next = new_node
+            node.prev = new_node
+            self._size += 1
+            self._version += 1
+
+    def _unlink(self, node: DoubleNode) -> None:
+        '''Internal method to detach a node from the list.'''
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+        self._size -= 1
+        self._version += 1
+
     def _add_first(self, data: object) -> None:
         '''Internal method to add a new node with the given data to the beginning of the list.'''
-        node = DoubleNode(data)
+        node = self._node_class(data)
         if self.is_empty():
             self._head = self._tail = node
         else:
@@ -62,6 +159,7 @@ class LinkedList(ABC):
             self._head.prev = node
             self._head = node
         self._size += 1
+        self._version += 1
 
     @abstractmethod
     def add_first(self, data: object) -> None:
@@ -70,7 +168,7 @@ class LinkedList(ABC):
 
     def _add_last(self, data: object) -> None:
         '''Internal method to add a new node with the given data to the end of the list.'''
-        node = DoubleNode(data)
+        node = self._node_class(data)
         if self.is_empty():
             self._head = self._tail = node
         else:
@@ -78,6 +176,7 @@ class LinkedList(ABC):
             self._tail.next = node
             self._tail = node
         self._size += 1
+        self._version += 1
 
     @abstractmethod
     def add_last(self, data: object) -> None:
@@ -99,15 +198,7 @@ class LinkedList(ABC):
         elif index == self._size:
             self.add_last(data)
         else:
-            node = DoubleNode(data)
-            current = self._head
-            for _ in range(index):
-                current = current.next
-            node.next = current
-            node.prev = current.prev
-            current.prev.next = node
-            current.prev = node
-            self._size += 1
+            self._link_before(self._node_at(index), data)
 
     @abstractmethod
     def insert(self, index: int, data: object) -> None:
@@ -132,10 +223,7 @@ class LinkedList(ABC):
         if index < 0 or index >= self._size:
             raise IndexListError()
         
-        node = self._head
-        for _ in range(index):
-            node = node.next
-        return node.data
+        return self._node_at(index).data
 
     def remove_first(self) -> object:
         '''
@@ -154,6 +242,7 @@ class LinkedList(ABC):
             self._head = self._head.next
             self._head.prev = None
         self._size -= 1
+        self._version += 1
         return data
         
     def remove_last(self) -> object:
@@ -173,6 +262,7 @@ class LinkedList(ABC):
             self._tail = self._tail.prev
             self._tail.next = None
         self._size -= 1
+        self._version += 1
         return data
         
     def remove(self, index: int) -> object:
@@ -193,24 +283,36 @@ class LinkedList(ABC):
         elif index == self._size - 1:
             data = self.remove_last()
         else:
-            node = self._head
-            for _ in range(index):
-                node = node.next
+            node = self._node_at(index)
             data = node.data
-            node.prev.next = node.next
-            node.next.prev = node.prev
-            self._size -= 1
+            self._unlink(node)
         return data
         
-    def _reverse(self, **kwargs) -> 'LinkedList':
-        '''Internal method to create and return a new reversed linked list.'''
-        reverse_list = self.__class__(**kwargs)
+    def _reverse(self) -> 'LinkedList':
+        '''Internal method to create and return a new reversed linked list configured like this one.'''
+        reverse_list = self._new_instance()
         node = self._tail
         while node is not None:
             reverse_list.add_last(node.data)
             node = node.prev
         return reverse_list
 
+    def clear(self) -> None:
+        '''
+        Removes every element of the list.
+
+        Nodes are unlinked one by one, so they are freed by reference counting as soon as they
+        are released instead of waiting for the cyclic garbage collector.
+        '''
+        node = self._head
+        self._head = self._tail = None
+        self._size = 0
+        self._version += 1
+        while node is not None:
+            next_node = node._next
+            node._prev = node._next = None
+            node = next_node
+
     @abstractmethod
     def reverse(self) -> 'LinkedList':
         '''Abstract method to create and return a new reversed linked list.'''
@@ -233,30 +335,192 @@ class LinkedList(ABC):
         '''Converts the linked list to a Python set.'''
         return set(self)
 
+    def index(self, value: object, start: int = 0, stop: int = None) -> int:
+        '''
+        Returns the index of the first occurrence of value between start and stop.
+
+        Raises:
+            ValueError: If the value is not present.
+        '''
+        positions = range(*slice(start, stop).indices(self._size))
+        for position, node in zip(positions, self._slice_nodes(slice(start, stop))):
+            if node.data is value or node.data == value:
+                return position
+        raise ValueError(f'{value!r} is not in list')
+
+    def __len__(self) -> int:
+        '''Returns the number of elements in the linked list.'''
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> object:
+        '''
+        Returns the data at the given index, or a new list of the same type for a slice.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if isinstance(index, slice):
+            sliced = self._new_instance()
+            for node in self._slice_nodes(index):
+                sliced._add_last(node.data)
+            return sliced
+        return self._node_at(self._normalize_index(index)).data
+
+    def __setitem__(self, index: Union[int, slice], data: Union[object, Iterable[object]]) -> None:
+        '''
+        Replaces the data at the given index, or the elements selected by a slice.
+
+        A contiguous slice may be replaced by any number of elements; an extended slice requires
+        the same number of elements it selects.
+
+        Raises:
+            IndexListError: If the index is out of range.
+            ValueError: If an extended slice and the iterable differ in size.
+        '''
+        if not isinstance(index, slice):
+            self._node_at(self._normalize_index(index)).data = data
+            return
+
+        values = list(data)
+        positions = range(*index.indices(self._size))
+        if positions.step != 1:
+            if len(values) != len(positions):
+                raise ValueError(
+                    f'attempt to assign sequence of size {len(values)} '
+                    f'to extended slice of size {len(positions)}'
+                )
+            for node, value in zip(self._slice_nodes(index), values):
+                node.data = value
+            return
+
+        count = len(positions)
+        self._ensure_capacity(len(values) - count)
+        node = self._node_at(positions.start) if (positions.start < self._size) else None
+        for value in values[:count]:
+            node.data = value
+            node = node.next
+        for _ in range(count - len(values)):
+            next_node = node.next
+            self._unlink(node)
+            node = next_node
+        for value in values[count:]:
+            self._link_before(node, value)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        '''
+        Removes the element at the given index, or the elements selected by a slice.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if isinstance(index, slice):
+            for node in self._slice_nodes(index):
+                self._unlink(node)
+        else:
+            self._unlink(self._node_at(self._normalize_index(index)))
+
+    def append(self, data: object) -> None:
+        '''Adds data to the end of the list.'''
+        self.add_last(data)
+
+    def extend(self, values: Iterable[object]) -> None:
+        '''Adds every value of an iterable to the end of the list.'''
+        if values is self:
+            values = self.to_list()
+        for data in values:
+            self.add_last(data)
+
+    def pop(self, index: int = -1) -> object:
+        '''
+        Removes and returns the data at the given index, the last element by default.
+
+        Raises:
+            EmptyList: If the list is empty.
+            IndexListError: If the index is out of range.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+        return self.remove(self._normalize_index(index))
+
+    def __iadd__(self, values: Iterable[object]) -> 'LinkedList':
+        '''Extends the list in place with the values of an iterable.'''
+        self.extend(values)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        '''Checks if two linked lists hold equal elements in the same order.'''
+        if not isinstance(other, LinkedList):
+            return NotImplemented
+        return self._size == other._size and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def snapshot_iter(self) -> Iterator[object]:
+        '''Returns an iterator over a copy of the current elements, unaffected by later changes.'''
+        return iter(self.to_tuple())
+
     def __iter__(self) -> Iterator[object]:
-        '''Iterator method to allow iterating through the elements of the linked list.'''
+        '''
+        Iterator method to allow iterating through the elements of the linked list.
+
+        Raises:
+            ConcurrentListModification: If the list is structurally modified during iteration.
+        '''
+        version = self._version
         node = self._head
         while node is not None:
             yield node.data
+            if self._version != version:
+                raise ConcurrentListModification()
             node = node.next
 
+    def __reversed__(self) -> Iterator[object]:
+        '''
+        Iterator method to allow iterating through the elements of the linked list backwards.
+
+        Raises:
+            ConcurrentListModification: If the list is structurally modified during iteration.
+        '''
+        version = self._version
+        node = self._tail
+        while node is not None:
+            yield node.data
+            if self._version != version:
+                raise ConcurrentListModification()
+            node = node.prev
+
 
 class BoundedList(LinkedList, Jsonifier):
     '''Class representing a bounded linked list with additional JSON serialization functionality.'''
 
-    def __init__(self, capacity: int = 10) -> None:
+    def __init__(self, capacity: int = 10, weak_prev: bool = False) -> None:
         '''
         Initializes a bounded linked list with the given capacity.
 
         Parameters:
             capacity (int): Maximum capacity of the list.
+            weak_prev (bool): Whether nodes refer to their predecessor through a weak reference.
         '''
-        LinkedList.__init__(self)
+        LinkedList.__init__(self, weak_prev)
         self._capacity = capacity
 
     def is_full(self) -> bool:
         '''Checks if the list is full.'''
         return self._size == self._capacity
+
+    def _new_instance(self) -> 'BoundedList':
+        '''Internal method to create an empty bounded list with the same capacity.'''
+        return self.__class__(self._capacity, self._node_class is WeakDoubleNode)
+
+    def _ensure_capacity(self, count: int) -> None:
+        '''
+        Internal method to check that `count` more elements fit in the list.
+
+        Raises:
+            FullList: If the list would exceed its capacity.
+        '''
+        if self._size + count > self._capacity:
+            raise FullList()
     
     def add_first(self, data: object) -> None:
         '''
@@ -296,7 +560,7 @@ class BoundedList(LinkedList, Jsonifier):
 
     def reverse(self) -> 'BoundedList':
         '''Creates and returns a new reversed bounded linked list.'''
-        return self._reverse(capacity=self._capacity)
+        return self._reverse()
 
     def assign_iterable(self, iterable: Union[List[object], Tuple[object], Set[object]]) -> None:
         '''
@@ -308,8 +572,7 @@ class BoundedList(LinkedList, Jsonifier):
         if type(iterable) not in self.ASSIGNABLE_ITERABLE_TYPES:
             raise InvalidIterableAssignment()
 
-        self._head = self._tail = None
-        self._size = 0
+        self.clear()
         self._capacity = len(iterable)
         for item in iterable:
             self.add_last(item)
@@ -322,13 +585,16 @@ class BoundedList(LinkedList, Jsonifier):
         '''Loads data from a JSON string into the linked list.'''
         self.assign_iterable(self._read_json_str(json_str))
 
-    def dump_json(self, file_path: str = None, indent: int = Jsonifier.JSON_INDENT, encoding: str = None) -> None:
-        '''Writes the linked list data to a JSON file.'''
-        self._write_json_file(self.to_list(), file_path, indent, encoding)
+    def dump_json(
+        self, file_path: str = None, indent: int = Jsonifier.JSON_INDENT, encoding: str = None,
+        separators: Tuple[str, str] = None
+    ) -> Dict[str, float]:
+        '''Writes the linked list data to a JSON file, returning its size in bytes and the duration.'''
+        return self._write_json_file(self.to_list(), file_path, indent, encoding, separators)
 
-    def dumps_json(self, indent: int = Jsonifier.JSON_INDENT) -> str:
+    def dumps_json(self, indent: int = Jsonifier.JSON_INDENT, separators: Tuple[str, str] = None) -> str:
         '''Returns a JSON string representation of the linked list.'''
-        return self._write_json_str(self.to_list(), indent)
+        return self._write_json_str(self.to_list(), indent, separators)
 
 
 class DynamicList(LinkedList, Jsonifier):
@@ -360,8 +626,7 @@ class DynamicList(LinkedList, Jsonifier):
         if type(iterable) not in self.ASSIGNABLE_ITERABLE_TYPES:
             raise InvalidIterableAssignment()
 
-        self._head = self._tail = None
-        self._size = 0
+        self.clear()
         for item in iterable:
             self.add_last(item)
     
@@ -373,10 +638,13 @@ class DynamicList(LinkedList, Jsonifier):
         '''Loads data from a JSON string into the linked list.'''
         self.assign_iterable(self._read_json_str(json_str))
 
-    def dump_json(self, file_path: str = None, indent: int = Jsonifier.JSON_INDENT, encoding: str = None) -> None:
-        '''Writes the linked list data to a JSON file.'''
-        self._write_json_file(self.to_list(), file_path, indent, encoding)
+    def dump_json(
+        self, file_path: str = None, indent: int = Jsonifier.JSON_INDENT, encoding: str = None,
+        separators: Tuple[str, str] = None
+    ) -> Dict[str, float]:
+        '''Writes the linked list data to a JSON file, returning its size in bytes and the duration.'''
+        return self._write_json_file(self.to_list(), file_path, indent, encoding, separators)
 
-    def dumps_json(self, indent: int = Jsonifier.JSON_INDENT) -> str:
+    def dumps_json(self, indent: int = Jsonifier.JSON_INDENT, separators: Tuple[str, str] = None) -> str:
         '''Returns a JSON string representation of the linked list.'''
-        return self._write_json_str(self.to_list(), indent)
+        return self._write_json_str(self.to_list(), indent, separators)
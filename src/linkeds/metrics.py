@@ -0,0 +1,220 @@
+from abc import ABC, abstractmethod
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict
+
+from .list import FullList
+from .queue import FullQueue
+from .stack import FullStack
+
+
+REJECTIONS = (FullList, FullQueue, FullStack)
+OPERATIONS = (
+    'add_first', 'add_last', 'insert', 'get', 'get_first', 'get_last',
+    'remove', 'remove_first', 'remove_last', 'assign_iterable', 'clear',
+    'append', 'extend', '__setitem__', '__delitem__', '__iadd__',
+    'enqueue', 'dequeue', 'drain', 'push', 'pop', 'peek',
+    'load_json', 'loads_json', 'dump_json', 'dumps_json'
+)
+
+
+class Exporter(ABC):
+    '''Abstract base class for sending the stats of instrumented structures elsewhere.'''
+
+    @abstractmethod
+    def export(self, name: str, stats: Dict[str, object]) -> None:
+        '''Abstract method to export the stats of the structure with the given name.'''
+        ...
+
+
+class CallbackExporter(Exporter):
+    '''Class representing an exporter that hands stats to a callable.'''
+
+    def __init__(self, callback: Callable[[str, Dict[str, object]], None]) -> None:
+        '''Initializes an exporter calling `callback(name, stats)` on every export.'''
+        self._callback = callback
+
+    def export(self, name: str, stats: Dict[str, object]) -> None:
+        '''Hands the stats of the structure with the given name to the callback.'''
+        self._callback(name, stats)
+
+
+class Metrics:
+    '''Class representing the counters recorded for an instrumented structure.'''
+
+    def __init__(self, name: str = None, exporter: Exporter = None) -> None:
+        '''Initializes empty counters, optionally bound to a name and an exporter.'''
+        self.name = name
+        self.exporter = exporter
+        self.depth = 0
+        self.operations = {}
+        self.rejected = {}
+        self.high_water_mark = 0
+        self.lookups = 0
+        self.nodes_traversed = 0
+        self.max_nodes_traversed = 0
+        self.serializations = 0
+        self.serialized_bytes = 0
+        self.serialization_time = 0.0
+
+    def record(self, operation: str, size: int) -> None:
+        '''Records a completed operation and the size it left the structure with.'''
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+        if size > self.high_water_mark:
+            self.high_water_mark = size
+
+    def reject(self, operation: str) -> None:
+        '''Records an operation rejected because the structure was full.'''
+        self.rejected[operation] = self.rejected.get(operation, 0) + 1
+
+    def traverse(self, nodes: int) -> None:
+        '''Records an indexed lookup that walked the given number of nodes.'''
+        self.lookups += 1
+        self.nodes_traversed += nodes
+        if nodes > self.max_nodes_traversed:
+            self.max_nodes_traversed = nodes
+
+    def serialize(self, size: int, seconds: float) -> None:
+        '''Records a serialization producing the given number of bytes.'''
+        self.serializations += 1
+        self.serialized_bytes += size
+        self.serialization_time += seconds
+
+    def stats(self) -> Dict[str, object]:
+        '''Returns a snapshot of the counters.'''
+        return {
+            'operations': dict(self.operations),
+            'rejected': dict(self.rejected),
+            'high_water_mark': self.high_water_mark,
+            'lookups': self.lookups,
+            'nodes_traversed': self.nodes_traversed,
+            'max_nodes_traversed': self.max_nodes_traversed,
+            'serializations': self.serializations,
+            'serialized_bytes': self.serialized_bytes,
+            'serialization_time': self.serialization_time,
+        }
+
+
+def _wrap_operation(name: str, method: Callable) -> Callable:
+    '''Wraps a public operation so only the outermost call of a structure is recorded.'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = self._metrics
+        metrics.depth += 1
+        try:
+            result = method(self, *args, **kwargs)
+        except REJECTIONS:
+            if metrics.depth == 1:
+                metrics.reject(name)
+            raise
+        finally:
+            metrics.depth -= 1
+        if metrics.depth == 0:
+            metrics.record(name, self._size)
+        return result
+    return wrapper
+
+
+def _wrap_node_at(method: Callable) -> Callable:
+    '''Wraps the positional seek of linked lists to record the nodes it walks.'''
+    @wraps(method)
+    def wrapper(self, index: int):
+        self._metrics.traverse(index if (index <= self._size // 2) else self._size - 1 - index)
+        return method(self, index)
+    return wrapper
+
+
+def _wrap_write_json_str(method: Callable) -> Callable:
+    '''Wraps JSON string serialization to record its size and duration.'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter()
+        json_str = method(self, *args, **kwargs)
+        self._metrics.serialize(len(json_str.encode()), perf_counter() - start)
+        return json_str
+    return wrapper
+
+
+def _wrap_write_json_file(method: Callable) -> Callable:
+    '''Wraps JSON file serialization to record the size of the file and the duration.'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._metrics.serialize(result['bytes'], result['seconds'])
+        return result
+    return wrapper
+
+
+def _stats(self) -> Dict[str, object]:
+    '''Returns the counters recorded for the structure.'''
+    return self._metrics.stats()
+
+
+def _export_stats(self) -> None:
+    '''Sends the counters recorded for the structure to its exporter, if any.'''
+    metrics = self._metrics
+    if metrics.exporter is not None:
+        metrics.exporter.export(metrics.name or self.__class__.__base__.__name__, metrics.stats())
+
+
+_INSTRUMENTED_CLASSES = {}
+
+
+def _instrumented_class(cls: type) -> type:
+    '''Returns the cached instrumented subclass of a structure class.'''
+    instrumented = _INSTRUMENTED_CLASSES.get(cls)
+    if instrumented is not None:
+        return instrumented
+
+    def __init__(self, *args, **kwargs) -> None:
+        cls.__init__(self, *args, **kwargs)
+        self._metrics = Metrics()
+
+    namespace = {'__init__': __init__, 'stats': _stats, 'export_stats': _export_stats}
+    for name in OPERATIONS:
+        method = getattr(cls, name, None)
+        if callable(method):
+            namespace[name] = _wrap_operation(name, method)
+    if hasattr(cls, '_node_at'):
+        namespace['_node_at'] = _wrap_node_at(cls._node_at)
+    if hasattr(cls, '_write_json_str'):
+        namespace['_write_json_str'] = _wrap_write_json_str(cls._write_json_str)
+    if hasattr(cls, '_write_json_file'):
+        namespace['_write_json_file'] = _wrap_write_json_file(cls._write_json_file)
+
+    instrumented = type(f'Instrumented{cls.__name__}', (cls,), namespace)
+    _INSTRUMENTED_CLASSES[cls] = instrumented
+    return instrumented
+
+
+def is_instrumented(structure: object) -> bool:
+    '''Checks if a structure is instrumented.'''
+    return type(structure) in _INSTRUMENTED_CLASSES.values()
+
+
+def instrument(structure: object, exporter: Exporter = None, name: str = None) -> object:
+    '''
+    Starts recording metrics for a structure and returns it.
+
+    The structure is switched to an instrumented subclass gaining `stats()` and `export_stats()`,
+    so structures that are not instrumented keep running the original code at no extra cost.
+    Structures created from it, such as reversed lists or slices, are instrumented as well.
+
+    Parameters:
+        structure (object): List, queue or stack to instrument.
+        exporter (Exporter): Optional destination for `export_stats()`.
+        name (str): Optional name passed to the exporter, the class name by default.
+    '''
+    if not is_instrumented(structure):
+        structure.__class__ = _instrumented_class(type(structure))
+    structure._metrics = Metrics(name, exporter)
+    structure._metrics.high_water_mark = structure._size
+    return structure
+
+
+def uninstrument(structure: object) -> object:
+    '''Stops recording metrics for a structure and returns it.'''
+    if is_instrumented(structure):
+        structure.__class__ = type(structure).__base__
+        del structure._metrics
+    return structure
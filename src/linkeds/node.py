@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from weakref import ref
 
 
 class Node(ABC):
@@ -80,3 +81,25 @@ class DoubleNode(Node):
     def prev(self, prev: 'DoubleNode') -> None:
         '''Setter method for updating the reference to the previous DoubleNode.'''
         self._prev = prev
+
+
+class WeakDoubleNode(DoubleNode):
+    '''Class representing a double node holding a weak reference to the previous node.'''
+
+    def __init__(self, data: object, prev: 'WeakDoubleNode' = None, next: 'WeakDoubleNode' = None) -> None:
+        '''
+        Initializes a WeakDoubleNode with the given data, optional weak reference to the previous
+        WeakDoubleNode, and optional reference to the next WeakDoubleNode.
+        '''
+        super().__init__(data, None, next)
+        self.prev = prev
+
+    @property
+    def prev(self) -> 'WeakDoubleNode':
+        '''Getter method for the previous WeakDoubleNode, or None if it was freed.'''
+        return self._prev() if (self._prev is not None) else None
+
+    @prev.setter
+    def prev(self, prev: 'WeakDoubleNode') -> None:
+        '''Setter method for updating the weak reference to the previous WeakDoubleNode.'''
+        self._prev = ref(prev) if (prev is not None) else None
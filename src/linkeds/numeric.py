@@ -0,0 +1,473 @@
+from array import array
+from typing import Callable, Dict, Iterator, List, Tuple, Set, Union
+import struct
+import sys
+
+from .jsonifier import Jsonifier
+from .list import ConcurrentListModification, EmptyList, IndexListError, InvalidIterableAssignment
+from .node import DoubleNode
+
+
+class InvalidNumericFile(Exception):
+    '''Exception raised for files that do not hold a dumped numeric list.'''
+
+    def __init__(self, message: str = 'Invalid numeric list file') -> None:
+        super().__init__(message)
+
+
+class NumericList(Jsonifier):
+    '''
+    Class representing a typed list of ints or floats stored in linked `array.array` chunks.
+
+    Each `DoubleNode` holds a chunk of up to `chunk_size` unboxed values instead of a single
+    element, so a list of doubles takes about 8 bytes per element. Aggregates run over whole
+    chunks in C, and the values can be exported as zero-copy `memoryview`s of each chunk or
+    dumped as a raw buffer.
+
+    Its API is narrower than `LinkedList`: it offers the add, insert, get, remove, reverse,
+    assign and JSON operations, integer indexing and item assignment, `clear` and fail-fast
+    iteration, but no slicing, `del`, `snapshot_iter` or reversed iteration, and it is not a
+    registered `Sequence`.
+    '''
+
+    CHUNK_SIZE = 1024
+    TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+    ASSIGNABLE_ITERABLE_TYPES = (list, tuple, set, array)
+    FILE_HEADER = struct.Struct('<4sccQ')
+    FILE_MAGIC = b'LNKD'
+
+    def __init__(self, typecode: str = 'd', chunk_size: int = CHUNK_SIZE) -> None:
+        '''
+        Initializes an empty numeric list.
+
+        Parameters:
+            typecode (str): `array` typecode of the elements, 'd' (double) by default.
+            chunk_size (int): Maximum number of elements kept in each node.
+
+        Raises:
+            ValueError: If the typecode is not numeric.
+        '''
+        if typecode not in self.TYPECODES:
+            raise ValueError(f'typecode must be one of {", ".join(self.TYPECODES)}')
+
+        self._typecode = typecode
+        self._chunk_size = chunk_size
+        self._head = self._tail = None
+        self._size = 0
+        self._version = 0
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the size attribute.'''
+        return self._size
+
+    @property
+    def typecode(self) -> str:
+        '''Getter method for the typecode attribute.'''
+        return self._typecode
+
+    def is_empty(self) -> bool:
+        '''Checks if the list is empty.'''
+        return self._size == 0
+
+    def _new_instance(self) -> 'NumericList':
+        '''Internal method to create an empty list configured like this one.'''
+        return self.__class__(self._typecode, self._chunk_size)
+
+    def _link_after(self, node: DoubleNode, chunk: array) -> DoubleNode:
+        '''Internal method to link a new node holding a chunk after a node, or first if None.'''
+        new_node = DoubleNode(chunk, node, node.next if (node is not None) else self._head)
+        if new_node.prev is None:
+            self._head = new_node
+        else:
+            new_node.prev.next = new_node
+        if new_node.next is None:
+            self._tail = new_node
+        else:
+            new_node.next.prev = new_node
+        return new_node
+
+    def _unlink(self, node: DoubleNode) -> None:
+        '''Internal method to detach an empty node from the list.'''
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+    def _locate(self, index: int) -> Tuple[DoubleNode, int]:
+        '''Internal method to return the node holding a valid index and the offset within it.'''
+        if index < self._size // 2:
+            node = self._head
+            while index >= len(node.data):
+                index -= len(node.data)
+                node = node.next
+            return node, index
+
+        index = self._size - 1 - index
+        node = self._tail
+        while index >= len(node.data):
+            index -= len(node.data)
+            node = node.prev
+        return node, len(node.data) - 1 - index
+
+    def _chunks(self) -> Iterator[array]:
+        '''Internal method to yield the chunks of the list in order.'''
+        node = self._head
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def add_first(self, data: Union[int, float]) -> None:
+        '''Adds data to the beginning of the list.'''
+        if self._head is None or len(self._head.data) >= self._chunk_size:
+            self._link_after(None, array(self._typecode))
+        self._head.data.insert(0, data)
+        self._size += 1
+        self._version += 1
+
+    def add_last(self, data: Union[int, float]) -> None:
+        '''Adds data to the end of the list.'''
+        if self._tail is None or len(self._tail.data) >= self._chunk_size:
+            self._link_after(self._tail, array(self._typecode))
+        self._tail.data.append(data)
+        self._size += 1
+        self._version += 1
+
+    def insert(self, index: int, data: Union[int, float]) -> None:
+        '''
+        Inserts data at the specified index.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0 or index > self._size:
+            raise IndexListError()
+
+        if index == self._size:
+            self.add_last(data)
+            return
+
+        node, offset = self._locate(index)
+        node.data.insert(offset, data)
+        if len(node.data) > self._chunk_size:
+            half = len(node.data) // 2
+            self._link_after(node, node.data[half:])
+            del node.data[half:]
+        self._size += 1
+        self._version += 1
+
+    def get_first(self) -> Union[int, float]:
+        '''Returns the data of the first element in the list.'''
+        return self._head.data[0] if (self._head is not None) else self._head
+
+    def get_last(self) -> Union[int, float]:
+        '''Returns the data of the last element in the list.'''
+        return self._tail.data[-1] if (self._tail is not None) else self._tail
+
+    def get(self, index: int) -> Union[int, float]:
+        '''
+        Returns the data of the element at the specified index.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0 or index >= self._size:
+            raise IndexListError()
+
+        node, offset = self._locate(index)
+        return node.data[offset]
+
+    def _remove_at(self, node: DoubleNode, offset: int) -> Union[int, float]:
+        '''Internal method to remove a value from a node, dropping the node once it is empty.'''
+        data = node.data.pop(offset)
+        if not node.data:
+            self._unlink(node)
+        self._size -= 1
+        self._version += 1
+        return data
+
+    def remove_first(self) -> Union[int, float]:
+        '''
+        Removes and returns the data of the first element in the list.
+
+        Raises:
+            EmptyList: If the list is empty.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+
+        return self._remove_at(self._head, 0)
+
+    def remove_last(self) -> Union[int, float]:
+        '''
+        Removes and returns the data of the last element in the list.
+
+        Raises:
+            EmptyList: If the list is empty.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+
+        return self._remove_at(self._tail, -1)
+
+    def remove(self, index: int) -> Union[int, float]:
+        '''
+        Removes and returns the data of the element at the specified index.
+
+        Raises:
+            EmptyList: If the list is empty.
+            IndexListError: If the index is out of range.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+        elif index < 0 or index >= self._size:
+            raise IndexListError()
+
+        return self._remove_at(*self._locate(index))
+
+    def reverse(self) -> 'NumericList':
+        '''Creates and returns a new reversed numeric list.'''
+        reverse_list = self._new_instance()
+        node = self._tail
+        while node is not None:
+            chunk = array(self._typecode, node.data)
+            chunk.reverse()
+            reverse_list._link_after(reverse_list._tail, chunk)
+            node = node.prev
+        reverse_list._size = self._size
+        return reverse_list
+
+    def clear(self) -> None:
+        '''Removes every element, unlinking the chunk nodes one by one.'''
+        node = self._head
+        self._head = self._tail = None
+        self._size = 0
+        self._version += 1
+        while node is not None:
+            next_node = node._next
+            node._prev = node._next = None
+            node = next_node
+
+    def _assign_array(self, values: array) -> None:
+        '''Internal method to replace the content of the list with the values of an array.'''
+        self.clear()
+        for start in range(0, len(values), self._chunk_size):
+            self._link_after(self._tail, values[start:start + self._chunk_size])
+        self._size = len(values)
+        self._version += 1
+
+    def assign_iterable(self, iterable: Union[List[object], Tuple[object], Set[object], array]) -> None:
+        '''
+        Assigns data from an iterable to the numeric list.
+
+        Raises:
+            InvalidIterableAssignment: If the iterable type is not supported.
+        '''
+        if type(iterable) not in self.ASSIGNABLE_ITERABLE_TYPES:
+            raise InvalidIterableAssignment()
+
+        self._assign_array(array(self._typecode, iterable))
+
+    def sum(self) -> Union[int, float]:
+        '''Returns the sum of the elements.'''
+        return sum(sum(chunk) for chunk in self._chunks())
+
+    def min(self) -> Union[int, float]:
+        '''
+        Returns the smallest element.
+
+        Raises:
+            EmptyList: If the list is empty.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+
+        return min(min(chunk) for chunk in self._chunks())
+
+    def max(self) -> Union[int, float]:
+        '''
+        Returns the largest element.
+
+        Raises:
+            EmptyList: If the list is empty.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+
+        return max(max(chunk) for chunk in self._chunks())
+
+    def map(self, function: Callable[[Union[int, float]], Union[int, float]], typecode: str = None) -> 'NumericList':
+        '''Returns a new numeric list with the function applied to every element, chunk by chunk.'''
+        mapped = self.__class__(typecode or self._typecode, self._chunk_size)
+        for chunk in self._chunks():
+            mapped._link_after(mapped._tail, array(mapped._typecode, map(function, chunk)))
+        mapped._size = self._size
+        return mapped
+
+    def to_array(self) -> array:
+        '''Converts the numeric list to a single `array.array`.'''
+        values = array(self._typecode)
+        for chunk in self._chunks():
+            values.extend(chunk)
+        return values
+
+    def to_list(self) -> List[Union[int, float]]:
+        '''Converts the numeric list to a Python list.'''
+        return self.to_array().tolist()
+
+    def to_tuple(self) -> Tuple[Union[int, float]]:
+        '''Converts the numeric list to a Python tuple.'''
+        return tuple(self.to_list())
+
+    def to_set(self) -> Set[Union[int, float]]:
+        '''Converts the numeric list to a Python set.'''
+        return set(self.to_list())
+
+    def chunk_views(self) -> Iterator[memoryview]:
+        '''
+        Yields a memoryview over each chunk of elements without copying them.
+
+        The views share memory with the list, so writing through them updates the elements. A
+        chunk cannot be resized while a view of it is alive: release the views before adding or
+        removing elements, or `BufferError` is raised. Use `to_array` for a contiguous copy.
+
+        Raises:
+            ConcurrentListModification: If the list is structurally modified during iteration.
+        '''
+        version = self._version
+        for chunk in self._chunks():
+            yield memoryview(chunk)
+            if self._version != version:
+                raise ConcurrentListModification()
+
+    def dump(self, file_path: str) -> None:
+        '''Writes the raw buffer of the elements to a binary file.'''
+        byteorder = b'<' if (sys.byteorder == 'little') else b'>'
+        with open(file_path, 'wb') as binary_file:
+            binary_file.write(self.FILE_HEADER.pack(
+                self.FILE_MAGIC, self._typecode.encode(), byteorder, self._size
+            ))
+            for chunk in self._chunks():
+                chunk.tofile(binary_file)
+
+    def load(self, file_path: str) -> None:
+        '''
+        Loads the elements of a binary file written by `dump`, replacing the current ones.
+
+        Raises:
+            InvalidNumericFile: If the file was not written by `dump` or is truncated.
+        '''
+        with open(file_path, 'rb') as binary_file:
+            header = binary_file.read(self.FILE_HEADER.size)
+            if len(header) != self.FILE_HEADER.size:
+                raise InvalidNumericFile()
+            magic, typecode, byteorder, size = self.FILE_HEADER.unpack(header)
+            typecode = typecode.decode()
+            if magic != self.FILE_MAGIC or typecode not in self.TYPECODES:
+                raise InvalidNumericFile()
+
+            values = array(typecode)
+            try:
+                values.fromfile(binary_file, size)
+            except EOFError as error:
+                raise InvalidNumericFile() from error
+
+        if byteorder != (b'<' if (sys.byteorder == 'little') else b'>'):
+            values.byteswap()
+        self._typecode = typecode
+        self._assign_array(values)
+
+    def load_json(self, file_path: str = None, encoding: str = None) -> None:
+        '''Loads data from a JSON file into the numeric list.'''
+        self.assign_iterable(self._read_json_file(file_path, encoding))
+
+    def loads_json(self, json_str: str) -> None:
+        '''Loads data from a JSON string into the numeric list.'''
+        self.assign_iterable(self._read_json_str(json_str))
+
+    def dump_json(
+        self, file_path: str = None, indent: int = Jsonifier.JSON_INDENT, encoding: str = None,
+        separators: Tuple[str, str] = None
+    ) -> Dict[str, float]:
+        '''Writes the numeric list data to a JSON file, returning its size in bytes and the duration.'''
+        return self._write_json_file(self.to_list(), file_path, indent, encoding, separators)
+
+    def dumps_json(self, indent: int = Jsonifier.JSON_INDENT, separators: Tuple[str, str] = None) -> str:
+        '''Returns a JSON string representation of the numeric list.'''
+        return self._write_json_str(self.to_list(), indent, separators)
+
+    def __len__(self) -> int:
+        '''Returns the number of elements in the numeric list.'''
+        return self._size
+
+    def __getitem__(self, index: int) -> Union[int, float]:
+        '''
+        Returns the data at the given index, counting from the end for negative indexes.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        return self.get(index + self._size if (index < 0) else index)
+
+    def __setitem__(self, index: int, data: Union[int, float]) -> None:
+        '''
+        Replaces the data at the given index, counting from the end for negative indexes.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexListError()
+
+        node, offset = self._locate(index)
+        node.data[offset] = data
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        '''
+        Iterator method to allow iterating through the elements of the numeric list.
+
+        Raises:
+            ConcurrentListModification: If the list is structurally modified during iteration.
+        '''
+        version = self._version
+        for chunk in self._chunks():
+            for data in chunk:
+                yield data
+                if self._version != version:
+                    raise ConcurrentListModification()
+
+    def __eq__(self, other: object) -> bool:
+        '''Checks if two numeric lists hold equal elements in the same order.'''
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self._size == other._size and self.to_array() == other.to_array()
+
+    def __lt__(self, other: 'NumericList') -> bool:
+        '''Compares two numeric lists lexicographically.'''
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self.to_array() < other.to_array()
+
+    def __le__(self, other: 'NumericList') -> bool:
+        '''Compares two numeric lists lexicographically.'''
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self.to_array() <= other.to_array()
+
+    def __gt__(self, other: 'NumericList') -> bool:
+        '''Compares two numeric lists lexicographically.'''
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self.to_array() > other.to_array()
+
+    def __ge__(self, other: 'NumericList') -> bool:
+        '''Compares two numeric lists lexicographically.'''
+        if not isinstance(other, NumericList):
+            return NotImplemented
+        return self.to_array() >= other.to_array()
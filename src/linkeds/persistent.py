@@ -0,0 +1,281 @@
+from typing import Iterable, Iterator, List, Tuple
+
+from .list import EmptyList, IndexListError
+from .node import SingleNode
+from .stack import EmptyStack, LinkedStack
+
+
+class PersistentStack:
+    '''
+    Class representing an immutable stack.
+
+    Every update returns a new version that shares its tail with the previous one, so pushing,
+    popping and snapshotting take constant time and memory.
+    '''
+
+    def __init__(self, iterable: Iterable[object] = ()) -> None:
+        '''Initializes a persistent stack by pushing the items of an iterable in order.'''
+        self._top = None
+        self._size = 0
+        for data in iterable:
+            self._top = SingleNode(data, self._top)
+            self._size += 1
+
+    @classmethod
+    def _from_chain(cls, top: SingleNode, size: int) -> 'PersistentStack':
+        '''Internal method to create a persistent stack on top of an existing node chain.'''
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._size = size
+        return stack
+
+    @classmethod
+    def from_stack(cls, stack: LinkedStack) -> 'PersistentStack':
+        '''
+        Creates a snapshot of a linked stack in constant time.
+
+        Linked stacks never modify their nodes, so the snapshot shares the whole node chain and
+        is unaffected by later pushes and pops on the original stack.
+        '''
+        return cls._from_chain(stack._top, stack._size)
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the size attribute.'''
+        return self._size
+
+    def is_empty(self) -> bool:
+        '''Checks if the stack is empty.'''
+        return self._size == 0
+
+    def push(self, data: object) -> 'PersistentStack':
+        '''Returns a new version of the stack with data on top.'''
+        return self._from_chain(SingleNode(data, self._top), self._size + 1)
+
+    def pop(self) -> 'PersistentStack':
+        '''
+        Returns a new version of the stack without its top element.
+
+        Raises:
+            EmptyStack: If the stack is empty.
+        '''
+        if self.is_empty():
+            raise EmptyStack()
+
+        return self._from_chain(self._top.next, self._size - 1)
+
+    def peek(self) -> object:
+        '''
+        Returns the data of the top element.
+
+        Returns:
+            object: Data of the top element, or None if the stack is empty.
+        '''
+        return self._top.data if (self._top is not None) else self._top
+
+    def to_list(self) -> List[object]:
+        '''Converts the stack to a Python list, from top to bottom.'''
+        return list(self)
+
+    def to_tuple(self) -> Tuple[object]:
+        '''Converts the stack to a Python tuple, from top to bottom.'''
+        return tuple(self)
+
+    def __len__(self) -> int:
+        '''Returns the number of elements in the stack.'''
+        return self._size
+
+    def __iter__(self) -> Iterator[object]:
+        '''Iterator method to allow iterating through the stack from top to bottom.'''
+        node = self._top
+        for _ in range(self._size):
+            yield node.data
+            node = node.next
+
+    def __eq__(self, other: object) -> bool:
+        '''Checks if two persistent stacks hold equal elements in the same order.'''
+        if not isinstance(other, PersistentStack):
+            return NotImplemented
+        return self._size == other._size and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        '''Returns a hash based on the elements of the stack.'''
+        return hash(self.to_tuple())
+
+
+class PersistentList:
+    '''
+    Class representing an immutable singly linked list.
+
+    Every update returns a new version. Prepending and removing the first element take constant
+    time; positional updates copy only the nodes before the index and share the rest.
+    '''
+
+    def __init__(self, iterable: Iterable[object] = ()) -> None:
+        '''Initializes a persistent list with the items of an iterable.'''
+        items = list(iterable)
+        self._head = self._link(items, None)
+        self._size = len(items)
+
+    @classmethod
+    def _from_chain(cls, head: SingleNode, size: int) -> 'PersistentList':
+        '''Internal method to create a persistent list on top of an existing node chain.'''
+        lst = cls.__new__(cls)
+        lst._head = head
+        lst._size = size
+        return lst
+
+    @staticmethod
+    def _link(prefix: List[object], node: SingleNode) -> SingleNode:
+        '''Internal method to build new nodes for a prefix of data in front of a shared node.'''
+        for data in reversed(prefix):
+            node = SingleNode(data, node)
+        return node
+
+    def _split(self, index: int) -> Tuple[List[object], SingleNode]:
+        '''Internal method to return the data before an index and the node found at it.'''
+        prefix = []
+        node = self._head
+        for _ in range(index):
+            prefix.append(node.data)
+            node = node.next
+        return prefix, node
+
+    def _check_index(self, index: int) -> None:
+        '''
+        Internal method to validate an index of an existing element.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0 or index >= self._size:
+            raise IndexListError()
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the size attribute.'''
+        return self._size
+
+    def is_empty(self) -> bool:
+        '''Checks if the list is empty.'''
+        return self._size == 0
+
+    def add_first(self, data: object) -> 'PersistentList':
+        '''Returns a new version of the list with data at the beginning.'''
+        return self._from_chain(SingleNode(data, self._head), self._size + 1)
+
+    def add_last(self, data: object) -> 'PersistentList':
+        '''Returns a new version of the list with data at the end, copying every node.'''
+        return self.insert(self._size, data)
+
+    def insert(self, index: int, data: object) -> 'PersistentList':
+        '''
+        Returns a new version of the list with data at the specified index.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        if index < 0 or index > self._size:
+            raise IndexListError()
+
+        prefix, node = self._split(index)
+        return self._from_chain(self._link(prefix, SingleNode(data, node)), self._size + 1)
+
+    def replace(self, index: int, data: object) -> 'PersistentList':
+        '''
+        Returns a new version of the list with the element at the specified index replaced.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        self._check_index(index)
+
+        prefix, node = self._split(index)
+        return self._from_chain(self._link(prefix, SingleNode(data, node.next)), self._size)
+
+    def remove_first(self) -> 'PersistentList':
+        '''
+        Returns a new version of the list without its first element.
+
+        Raises:
+            EmptyList: If the list is empty.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+
+        return self._from_chain(self._head.next, self._size - 1)
+
+    def remove(self, index: int) -> 'PersistentList':
+        '''
+        Returns a new version of the list without the element at the specified index.
+
+        Raises:
+            EmptyList: If the list is empty.
+            IndexListError: If the index is out of range.
+        '''
+        if self.is_empty():
+            raise EmptyList()
+        self._check_index(index)
+
+        prefix, node = self._split(index)
+        return self._from_chain(self._link(prefix, node.next), self._size - 1)
+
+    def get_first(self) -> object:
+        '''Returns the data of the first element in the list.'''
+        return self._head.data if (self._head is not None) else self._head
+
+    def get(self, index: int) -> object:
+        '''
+        Returns the data of the element at the specified index.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        self._check_index(index)
+
+        return self._split(index)[1].data
+
+    def reverse(self) -> 'PersistentList':
+        '''Returns a new reversed version of the list.'''
+        head = None
+        for data in self:
+            head = SingleNode(data, head)
+        return self._from_chain(head, self._size)
+
+    def to_list(self) -> List[object]:
+        '''Converts the list to a Python list.'''
+        return list(self)
+
+    def to_tuple(self) -> Tuple[object]:
+        '''Converts the list to a Python tuple.'''
+        return tuple(self)
+
+    def __len__(self) -> int:
+        '''Returns the number of elements in the list.'''
+        return self._size
+
+    def __getitem__(self, index: int) -> object:
+        '''
+        Returns the data at the given index, counting from the end for negative indexes.
+
+        Raises:
+            IndexListError: If the index is out of range.
+        '''
+        return self.get(index + self._size if (index < 0) else index)
+
+    def __iter__(self) -> Iterator[object]:
+        '''Iterator method to allow iterating through the elements of the list.'''
+        node = self._head
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def __eq__(self, other: object) -> bool:
+        '''Checks if two persistent lists hold equal elements in the same order.'''
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        return self._size == other._size and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        '''Returns a hash based on the elements of the list.'''
+        return hash(self.to_tuple())
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+
 from .node import SingleNode
 
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List
+
+
 class EmptyQueue(Exception):
     '''Exception raised for attempting operations on an empty queue.'''
 
@@ -16,6 +22,13 @@ class FullQueue(Exception):
         super().__init__(message)
 
 
+class ConcurrentQueueModification(RuntimeError):
+    '''Exception raised when a queue is modified while being iterated.'''
+
+    def __init__(self, message: str = 'Queue changed during iteration') -> None:
+        super().__init__(message)
+
+
 class LinkedQueue(ABC):
     '''Abstract base class for a linked queue.'''
 
@@ -23,6 +36,7 @@ class LinkedQueue(ABC):
         '''Initializes an empty linked queue.'''
         self._front = self._rear = None
         self._size = 0
+        self._version = 0
 
     @property
     def size(self) -> int:
@@ -42,6 +56,7 @@ class LinkedQueue(ABC):
             self._rear.next = node
             self._rear = node
         self._size += 1
+        self._version += 1
 
     @abstractmethod
     def enqueue(self, data: object) -> None:
@@ -61,10 +76,45 @@ class LinkedQueue(ABC):
         data = self._front.data
         self._front = self._front.next
         self._size -= 1
+        self._version += 1
         if self.is_empty():
             self._rear = None
         return data
 
+    def drain(self, count: int = None) -> 'List[object]':
+        '''
+        Removes and returns up to `count` elements from the front in one pass.
+
+        Returns:
+            list: Removed elements in FIFO order, all of them if count is None.
+
+        Raises:
+            ValueError: If the count is negative.
+        '''
+        if count is not None and count < 0:
+            raise ValueError('count must not be negative')
+
+        count = self._size if (count is None) else min(count, self._size)
+        items = list(self._walk(self._front, count))
+        for _ in range(count):
+            self._front = self._front.next
+        self._size -= count
+        self._version += bool(count)
+        if self.is_empty():
+            self._rear = None
+        return items
+
+    def clear(self) -> None:
+        '''
+        Removes every element from the queue.
+
+        The chain is singly linked and free of cycles, so dropping the front is enough; nodes are
+        left untouched because snapshots may still share them.
+        '''
+        self._front = self._rear = None
+        self._size = 0
+        self._version += 1
+
     def peek(self) -> object:
         '''
         Returns the data of the front element without removing it.
@@ -73,6 +123,34 @@ class LinkedQueue(ABC):
             object: Data of the front element, or None if the queue is empty.
         '''
         return self._front.data if (self._front is not None) else self._front
+
+    @staticmethod
+    def _walk(node: SingleNode, count: int) -> 'Iterator[object]':
+        '''Internal method to yield the data of `count` nodes starting at the given node.'''
+        for _ in range(count):
+            yield node.data
+            node = node.next
+
+    def snapshot_iter(self) -> 'Iterator[object]':
+        '''
+        Returns an iterator over the current elements, from front to rear, unaffected by later changes.
+
+        Nodes are never modified once linked, so the snapshot is taken in constant time.
+        '''
+        return self._walk(self._front, self._size)
+
+    def __iter__(self) -> 'Iterator[object]':
+        '''
+        Iterator method to allow iterating through the queue from front to rear.
+
+        Raises:
+            ConcurrentQueueModification: If the queue is modified during iteration.
+        '''
+        version = self._version
+        for data in self._walk(self._front, self._size):
+            yield data
+            if self._version != version:
+                raise ConcurrentQueueModification()
     
 
 class BoundedQueue(LinkedQueue):
@@ -0,0 +1,201 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from os import cpu_count
+from threading import Condition, Lock, local
+from typing import Callable, Optional, Tuple
+
+from .list import DynamicList
+
+
+class EmptyDeque(Exception):
+    '''Exception raised for attempting to take a task from an empty deque.'''
+
+    def __init__(self, message: str = 'Deque is empty') -> None:
+        super().__init__(message)
+
+
+class WorkStealingDeque:
+    '''
+    Class representing a work-stealing deque backed by a dynamic linked list.
+
+    The owning worker pushes and pops tasks at the bottom in LIFO order, keeping recently forked
+    work hot, while thieves steal the oldest tasks from the top.
+    '''
+
+    def __init__(self) -> None:
+        '''Initializes an empty work-stealing deque.'''
+        self._list = DynamicList()
+        self._lock = Lock()
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the size attribute.'''
+        return self._list.size
+
+    def is_empty(self) -> bool:
+        '''Checks if the deque is empty.'''
+        return self._list.is_empty()
+
+    def push(self, data: object) -> None:
+        '''Pushes data onto the bottom of the deque.'''
+        with self._lock:
+            self._list.add_last(data)
+
+    def pop(self) -> object:
+        '''
+        Removes and returns the data at the bottom of the deque.
+
+        Raises:
+            EmptyDeque: If the deque is empty.
+        '''
+        with self._lock:
+            if self._list.is_empty():
+                raise EmptyDeque()
+            return self._list.remove_last()
+
+    def steal(self) -> object:
+        '''
+        Removes and returns the data at the top of the deque.
+
+        Raises:
+            EmptyDeque: If the deque is empty.
+        '''
+        with self._lock:
+            if self._list.is_empty():
+                raise EmptyDeque()
+            return self._list.remove_first()
+
+
+class WorkStealingScheduler:
+    '''
+    Class representing a fork/join task scheduler with one work-stealing deque per worker.
+
+    Worker loops run on a `ThreadPoolExecutor`. Tasks submitted from a worker are forked onto its
+    own deque, other submissions are spread round-robin, and idle workers steal from the others.
+    Joining from a worker runs pending tasks instead of blocking the thread.
+    '''
+
+    def __init__(self, workers: int = None) -> None:
+        '''
+        Initializes and starts a scheduler.
+
+        Parameters:
+            workers (int): Number of worker threads, the CPU count by default.
+        '''
+        self._workers = workers or cpu_count() or 1
+        self._deques = [WorkStealingDeque() for _ in range(self._workers)]
+        self._condition = Condition(Lock())
+        self._pending = 0
+        self._next_deque = 0
+        self._shutdown = False
+        self._local = local()
+        self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix='linkeds-worker')
+        for index in range(self._workers):
+            self._executor.submit(self._work, index)
+
+    @property
+    def workers(self) -> int:
+        '''Getter method for the workers attribute.'''
+        return self._workers
+
+    def _worker_index(self) -> Optional[int]:
+        '''Internal method to return the index of the current worker, or None outside workers.'''
+        return getattr(self._local, 'index', None)
+
+    def _take(self, index: int) -> Optional[Tuple[Callable, tuple, dict, Future]]:
+        '''Internal method to pop a task from a worker's deque or steal one from the others.'''
+        try:
+            task = self._deques[index].pop()
+        except EmptyDeque:
+            task = None
+            for offset in range(1, self._workers):
+                try:
+                    task = self._deques[(index + offset) % self._workers].steal()
+                    break
+                except EmptyDeque:
+                    continue
+        if task is not None:
+            with self._condition:
+                self._pending -= 1
+        return task
+
+    @staticmethod
+    def _run(task: Tuple[Callable, tuple, dict, Future]) -> None:
+        '''Internal method to run a task and settle its future.'''
+        fn, args, kwargs, future = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as error:
+            future.set_exception(error)
+
+    def _work(self, index: int) -> None:
+        '''Internal method running the loop of a worker.'''
+        self._local.index = index
+        while True:
+            with self._condition:
+                while self._pending == 0 and not self._shutdown:
+                    self._condition.wait()
+                if self._pending == 0:
+                    return
+            task = self._take(index)
+            if task is not None:
+                self._run(task)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        '''
+        Schedules fn(*args, **kwargs) and returns a future for its result.
+
+        Tasks already running may keep forking while the scheduler shuts down.
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down.
+        '''
+        future = Future()
+        index = self._worker_index()
+        with self._condition:
+            if self._shutdown and index is None:
+                raise RuntimeError('cannot schedule new tasks after shutdown')
+            if index is None:
+                index = self._next_deque
+                self._next_deque = (self._next_deque + 1) % self._workers
+            self._deques[index].push((fn, args, kwargs, future))
+            self._pending += 1
+            self._condition.notify()
+        return future
+
+    def fork(self, fn: Callable, *args, **kwargs) -> Future:
+        '''Alias of submit for use inside tasks.'''
+        return self.submit(fn, *args, **kwargs)
+
+    def join(self, future: Future) -> object:
+        '''
+        Returns the result of a future, running other tasks while waiting inside a worker.
+
+        Raises:
+            Exception: Whatever the task raised.
+        '''
+        index = self._worker_index()
+        if index is not None:
+            while not future.done():
+                task = self._take(index)
+                if task is None:
+                    wait_futures((future,), timeout=0.001)
+                else:
+                    self._run(task)
+        return future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        '''Stops accepting tasks; workers exit once every pending task has run.'''
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> 'WorkStealingScheduler':
+        '''Returns the scheduler for use as a context manager.'''
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        '''Shuts the scheduler down, waiting for pending tasks.'''
+        self.shutdown()
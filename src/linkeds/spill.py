@@ -0,0 +1,218 @@
+from os import listdir, makedirs, path, remove, replace
+from typing import List
+import pickle
+import struct
+
+from .queue import DynamicQueue
+
+
+class SpillingQueue:
+    '''
+    Class representing a FIFO queue that spills to append-only segment files.
+
+    The oldest items live in a bounded in-memory linked queue. Once it holds `memory_limit`
+    items, newer ones are buffered and written to disk in segments of `segment_size`
+    length-prefixed records. Segments are read back sequentially when memory runs dry, so FIFO
+    order holds across memory and disk. Reopening a directory replays its segment files.
+
+    Durability is limited. Only `close()` persists the items held in memory, which are the
+    oldest ones, so a crash loses up to `memory_limit` of them as well as buffered items not yet
+    flushed. A segment file is deleted only once every item read from it has been dequeued, so
+    after a crash the items already consumed from it are delivered again (at-least-once).
+    '''
+
+    SEGMENT_PREFIX = 'segment-'
+    SEGMENT_SUFFIX = '.log'
+    RECORD_HEADER = struct.Struct('>I')
+
+    def __init__(self, directory: str, memory_limit: int = 10_000, segment_size: int = 1_000) -> None:
+        '''
+        Initializes a spilling queue, replaying the segments found in the directory.
+
+        Parameters:
+            directory (str): Folder holding the segment files.
+            memory_limit (int): Maximum number of items kept in memory before spilling.
+            segment_size (int): Number of items written per segment file.
+        '''
+        makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._memory_limit = memory_limit
+        self._segment_size = segment_size
+        self._memory = DynamicQueue()
+        self._buffer = []
+        self._segments = DynamicQueue()
+        self._spilled = 0
+        self._reading = None
+        self._reading_left = 0
+
+        sequences = sorted(
+            int(name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)])
+            for name in listdir(directory)
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.SEGMENT_SUFFIX)
+        )
+        for sequence in sequences:
+            segment_path = self._segment_path(sequence)
+            self._segments.enqueue((sequence, segment_path))
+            self._spilled += self._count_records(segment_path)
+        self._first_sequence = sequences[0] if sequences else 0
+        self._next_sequence = sequences[-1] + 1 if sequences else 0
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the number of items in memory and on disk.'''
+        return self._memory.size + self._spilled + len(self._buffer)
+
+    @property
+    def spilled(self) -> int:
+        '''Getter method for the number of items held in segment files.'''
+        return self._spilled
+
+    def is_empty(self) -> bool:
+        '''Checks if the queue is empty.'''
+        return self.size == 0
+
+    def _segment_path(self, sequence: int) -> str:
+        '''Internal method to return the file path of a segment.'''
+        return path.join(self._directory, f'{self.SEGMENT_PREFIX}{sequence}{self.SEGMENT_SUFFIX}')
+
+    def _count_records(self, segment_path: str) -> int:
+        '''Internal method to count the records of a segment by skipping over their payloads.'''
+        count = 0
+        with open(segment_path, 'rb') as segment_file:
+            while True:
+                header = segment_file.read(self.RECORD_HEADER.size)
+                if len(header) < self.RECORD_HEADER.size:
+                    return count
+                segment_file.seek(self.RECORD_HEADER.unpack(header)[0], 1)
+                count += 1
+
+    def _write_segment(self, sequence: int, items: List[object]) -> str:
+        '''Internal method to write items to a segment file in one batch, atomically.'''
+        records = []
+        for data in items:
+            payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+            records.append(self.RECORD_HEADER.pack(len(payload)))
+            records.append(payload)
+        segment_path = self._segment_path(sequence)
+        temp_path = f'{segment_path}.tmp'
+        with open(temp_path, 'wb') as segment_file:
+            segment_file.write(b''.join(records))
+        replace(temp_path, segment_path)
+        return segment_path
+
+    def _read_segment(self, segment_path: str) -> List[object]:
+        '''Internal method to read every record of a segment file sequentially.'''
+        with open(segment_path, 'rb') as segment_file:
+            content = segment_file.read()
+        items = []
+        offset = 0
+        while offset < len(content):
+            length = self.RECORD_HEADER.unpack_from(content, offset)[0]
+            offset += self.RECORD_HEADER.size
+            items.append(pickle.loads(content[offset:offset + length]))
+            offset += length
+        return items
+
+    def flush(self) -> None:
+        '''Writes the buffered items to a new segment file.'''
+        if self._buffer:
+            self._write_segment(self._next_sequence, self._buffer)
+            self._segments.enqueue((self._next_sequence, self._segment_path(self._next_sequence)))
+            self._next_sequence += 1
+            self._spilled += len(self._buffer)
+            self._buffer = []
+
+    def enqueue(self, data: object) -> None:
+        '''Enqueues data, spilling it to disk when memory is full.'''
+        if self._spilled == 0 and not self._buffer and self._memory.size < self._memory_limit:
+            self._memory.enqueue(data)
+            return
+
+        self._buffer.append(data)
+        if len(self._buffer) >= self._segment_size:
+            self.flush()
+
+    def _refill(self) -> None:
+        '''Internal method to load the oldest spilled items into memory.'''
+        if not self._segments.is_empty():
+            _, segment_path = self._segments.dequeue()
+            items = self._read_segment(segment_path)
+            self._spilled -= len(items)
+            self._reading = segment_path
+            self._reading_left = len(items)
+        else:
+            items, self._buffer = self._buffer, []
+        for data in items:
+            self._memory.enqueue(data)
+
+    def dequeue(self) -> object:
+        '''
+        Removes and returns the oldest item.
+
+        Raises:
+            EmptyQueue: If the queue is empty.
+        '''
+        if self._memory.is_empty():
+            self._refill()
+        data = self._memory.dequeue()
+
+        if self._reading is not None:
+            self._reading_left -= 1
+            if self._reading_left == 0:
+                remove(self._reading)
+                self._reading = None
+        return data
+
+    def peek(self) -> object:
+        '''
+        Returns the oldest item without removing it.
+
+        Returns:
+            object: Data of the oldest item, or None if the queue is empty.
+        '''
+        if self._memory.is_empty():
+            self._refill()
+        return self._memory.peek()
+
+    def clear(self) -> None:
+        '''Removes every item, deleting the segment files.'''
+        self._memory.clear()
+        self._buffer = []
+        while not self._segments.is_empty():
+            remove(self._segments.dequeue()[1])
+        if self._reading is not None:
+            remove(self._reading)
+        self._reading = None
+        self._reading_left = 0
+        self._spilled = 0
+
+    def close(self) -> None:
+        '''
+        Writes every item left in memory and in the buffer to segment files.
+
+        Items still in memory become the first segment, so reopening the directory resumes
+        the queue in the same order.
+        '''
+        self.flush()
+        items = self._memory.drain()
+        if self._reading is not None:
+            sequence = int(path.basename(self._reading)[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)])
+        else:
+            self._first_sequence -= 1
+            sequence = self._first_sequence
+        if items:
+            self._write_segment(sequence, items)
+        elif self._reading is not None:
+            remove(self._reading)
+        self._reading = None
+        self._reading_left = 0
+        self._segments = DynamicQueue()
+        self._spilled = 0
+
+    def __enter__(self) -> 'SpillingQueue':
+        '''Returns the queue for use as a context manager.'''
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        '''Closes the queue, persisting the items left in memory.'''
+        self.close()
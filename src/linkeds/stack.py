@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+
 from .node import SingleNode
 
 
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
 class EmptyStack(Exception):
     '''Exception raised for attempting operations on an empty stack.'''
 
@@ -16,6 +22,13 @@ class FullStack(Exception):
         super().__init__(message)
 
 
+class ConcurrentStackModification(RuntimeError):
+    '''Exception raised when a stack is modified while being iterated.'''
+
+    def __init__(self, message: str = 'Stack changed during iteration') -> None:
+        super().__init__(message)
+
+
 class LinkedStack(ABC):
     '''Abstract base class for a linked stack.'''
 
@@ -23,6 +36,7 @@ class LinkedStack(ABC):
         '''Initializes an empty linked stack.'''
         self._top = None
         self._size = 0
+        self._version = 0
 
     @property
     def size(self) -> int:
@@ -37,6 +51,7 @@ class LinkedStack(ABC):
         '''Internal method to push a new node with the given data onto the stack.'''
         self._top = SingleNode(data, self._top)
         self._size += 1
+        self._version += 1
 
     @abstractmethod
     def push(self, data: object) -> None:
@@ -56,6 +71,7 @@ class LinkedStack(ABC):
         data = self._top.data
         self._top = self._top.next
         self._size -= 1
+        self._version += 1
         return data
 
     def peek(self) -> object:
@@ -67,6 +83,45 @@ class LinkedStack(ABC):
         '''
         return self._top.data if (self._top is not None) else self._top
 
+    def clear(self) -> None:
+        '''
+        Removes every element from the stack.
+
+        The chain is singly linked and free of cycles, so dropping the top is enough; nodes are
+        left untouched because snapshots and persistent stacks may still share them.
+        '''
+        self._top = None
+        self._size = 0
+        self._version += 1
+
+    @staticmethod
+    def _walk(node: SingleNode, count: int) -> 'Iterator[object]':
+        '''Internal method to yield the data of `count` nodes starting at the given node.'''
+        for _ in range(count):
+            yield node.data
+            node = node.next
+
+    def snapshot_iter(self) -> 'Iterator[object]':
+        '''
+        Returns an iterator over the current elements, from top to bottom, unaffected by later changes.
+
+        Nodes are never modified once linked, so the snapshot is taken in constant time.
+        '''
+        return self._walk(self._top, self._size)
+
+    def __iter__(self) -> 'Iterator[object]':
+        '''
+        Iterator method to allow iterating through the stack from top to bottom.
+
+        Raises:
+            ConcurrentStackModification: If the stack is modified during iteration.
+        '''
+        version = self._version
+        for data in self._walk(self._top, self._size):
+            yield data
+            if self._version != version:
+                raise ConcurrentStackModification()
+
 
 class BoundedStack(LinkedStack):
     '''Class representing a bounded (fixed-size) stack.'''
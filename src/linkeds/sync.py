@@ -0,0 +1,245 @@
+from contextlib import contextmanager
+from threading import Condition, Lock, local
+from time import perf_counter
+from typing import Dict, Iterator, List, Tuple, Set, Union
+
+from .list import LinkedList, DynamicList
+
+
+class ReadWriteLock:
+    '''
+    Class representing a writer-preferring reader-writer lock.
+
+    Any number of readers may hold the lock at once, while writers get exclusive access. New
+    readers wait as soon as a writer is waiting, so a steady flow of readers cannot starve writers.
+    '''
+
+    def __init__(self) -> None:
+        '''Initializes an unlocked reader-writer lock.'''
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self, blocking: bool = True) -> bool:
+        '''Acquires the lock for reading, returning False if not blocking and unavailable.'''
+        with self._condition:
+            if not blocking and (self._writer or self._waiting_writers):
+                return False
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+            return True
+
+    def release_read(self) -> None:
+        '''Releases the lock held for reading.'''
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self, blocking: bool = True) -> bool:
+        '''Acquires the lock for writing, returning False if not blocking and unavailable.'''
+        with self._condition:
+            if not blocking and (self._writer or self._readers):
+                return False
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            return True
+
+    def release_write(self) -> None:
+        '''Releases the lock held for writing.'''
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        '''Context manager holding the lock for reading.'''
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        '''Context manager holding the lock for writing.'''
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentList:
+    '''
+    Class representing a thread-safe wrapper around a linked list.
+
+    Reads share a writer-preferring reader-writer lock, writes hold it exclusively, and every
+    operation records how often it had to wait for the lock and for how long. Stats are kept per
+    thread and merged by `stats()`, so recording them adds no lock of its own to each call.
+    '''
+
+    def __init__(self, linked_list: LinkedList = None) -> None:
+        '''
+        Initializes a concurrent list around the given linked list.
+
+        Parameters:
+            linked_list (LinkedList): List to protect, a new DynamicList by default.
+        '''
+        self._list = linked_list if (linked_list is not None) else DynamicList()
+        self._lock = ReadWriteLock()
+        self._local = local()
+        self._thread_stats = []
+        self._stats_lock = Lock()
+
+    def _record(self, operation: str, contended: bool, wait_time: float) -> None:
+        '''Internal method to record a lock acquisition in the stats of the calling thread.'''
+        thread_stats = getattr(self._local, 'stats', None)
+        if thread_stats is None:
+            thread_stats = self._local.stats = {}
+            with self._stats_lock:
+                self._thread_stats.append(thread_stats)
+
+        stats = thread_stats.get(operation)
+        if stats is None:
+            stats = thread_stats[operation] = [0, 0, 0.0]
+        stats[0] += 1
+        stats[1] += contended
+        stats[2] += wait_time
+
+    @contextmanager
+    def _locked(self, operation: str, write: bool) -> Iterator[None]:
+        '''Internal context manager acquiring the lock for an operation and recording contention.'''
+        acquire = self._lock.acquire_write if write else self._lock.acquire_read
+        release = self._lock.release_write if write else self._lock.release_read
+        wait_time = 0.0
+        contended = not acquire(blocking=False)
+        if contended:
+            start = perf_counter()
+            acquire()
+            wait_time = perf_counter() - start
+        self._record(operation, contended, wait_time)
+        try:
+            yield
+        finally:
+            release()
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the size attribute.'''
+        with self._locked('size', write=False):
+            return self._list.size
+
+    def is_empty(self) -> bool:
+        '''Checks if the list is empty.'''
+        with self._locked('is_empty', write=False):
+            return self._list.is_empty()
+
+    def get_first(self) -> object:
+        '''Returns the data of the first element in the list.'''
+        with self._locked('get_first', write=False):
+            return self._list.get_first()
+
+    def get_last(self) -> object:
+        '''Returns the data of the last element in the list.'''
+        with self._locked('get_last', write=False):
+            return self._list.get_last()
+
+    def get(self, index: int) -> object:
+        '''Returns the data of the element at the specified index.'''
+        with self._locked('get', write=False):
+            return self._list.get(index)
+
+    def to_list(self) -> List[object]:
+        '''Converts the list to a Python list.'''
+        with self._locked('to_list', write=False):
+            return self._list.to_list()
+
+    def to_tuple(self) -> Tuple[object]:
+        '''Converts the list to a Python tuple.'''
+        with self._locked('to_tuple', write=False):
+            return self._list.to_tuple()
+
+    def add_first(self, data: object) -> None:
+        '''Adds data to the beginning of the list.'''
+        with self._locked('add_first', write=True):
+            self._list.add_first(data)
+
+    def add_last(self, data: object) -> None:
+        '''Adds data to the end of the list.'''
+        with self._locked('add_last', write=True):
+            self._list.add_last(data)
+
+    def insert(self, index: int, data: object) -> None:
+        '''Inserts data at the specified index.'''
+        with self._locked('insert', write=True):
+            self._list.insert(index, data)
+
+    def remove_first(self) -> object:
+        '''Removes and returns the data of the first element in the list.'''
+        with self._locked('remove_first', write=True):
+            return self._list.remove_first()
+
+    def remove_last(self) -> object:
+        '''Removes and returns the data of the last element in the list.'''
+        with self._locked('remove_last', write=True):
+            return self._list.remove_last()
+
+    def remove(self, index: int) -> object:
+        '''Removes and returns the data of the element at the specified index.'''
+        with self._locked('remove', write=True):
+            return self._list.remove(index)
+
+    def assign_iterable(self, iterable: Union[List[object], Tuple[object], Set[object]]) -> None:
+        '''Assigns data from an iterable to the list.'''
+        with self._locked('assign_iterable', write=True):
+            self._list.assign_iterable(iterable)
+
+    def clear(self) -> None:
+        '''Removes every element of the list.'''
+        with self._locked('clear', write=True):
+            self._list.clear()
+
+    @contextmanager
+    def transaction(self) -> Iterator[LinkedList]:
+        '''
+        Context manager holding the write lock for a batch of changes.
+
+        Yields the underlying linked list, which must not be used after the block exits.
+        '''
+        with self._locked('transaction', write=True):
+            yield self._list
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        '''Returns the calls, contended acquisitions and total wait time of each operation.'''
+        merged = {}
+        with self._stats_lock:
+            thread_stats = list(self._thread_stats)
+        for stats in thread_stats:
+            for operation, (calls, contended, wait_time) in dict(stats).items():
+                totals = merged.setdefault(operation, {'calls': 0, 'contended': 0, 'wait_time': 0.0})
+                totals['calls'] += calls
+                totals['contended'] += contended
+                totals['wait_time'] += wait_time
+        return merged
+
+    def snapshot_iter(self) -> Iterator[object]:
+        '''Returns an iterator over a copy of the current elements.'''
+        return iter(self.to_tuple())
+
+    def __len__(self) -> int:
+        '''Returns the number of elements in the list.'''
+        return self.size
+
+    def __iter__(self) -> Iterator[object]:
+        '''
+        Iterator method over a copy of the elements taken under the read lock.
+
+        Holding the lock across yields could deadlock a consumer that writes to the list.
+        '''
+        return self.snapshot_iter()
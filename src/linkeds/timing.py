@@ -0,0 +1,181 @@
+from math import floor
+from typing import List
+
+from .list import DynamicList
+from .node import DoubleNode
+
+
+class TimerHandle:
+    '''Class representing a timer scheduled on a timing wheel, used to cancel it.'''
+
+    def __init__(self, wheel: 'TimingWheel', deadline: int, item: object) -> None:
+        '''Initializes a handle for an item expiring at the given tick.'''
+        self._wheel = wheel
+        self._deadline = deadline
+        self._item = item
+        self._bucket = None
+        self._node = None
+
+    @property
+    def item(self) -> object:
+        '''Getter method for the item attribute.'''
+        return self._item
+
+    @property
+    def deadline(self) -> float:
+        '''Getter method for the deadline, in the time unit of the wheel.'''
+        return self._deadline * self._wheel.tick
+
+    def is_active(self) -> bool:
+        '''Checks if the timer is still waiting to expire.'''
+        return self._bucket is not None
+
+    def cancel(self) -> bool:
+        '''Cancels the timer, returning False if it already expired or was cancelled.'''
+        return self._wheel.cancel(self)
+
+
+class TimingWheel:
+    '''
+    Class representing a hierarchical timing wheel.
+
+    Each level has `slots` buckets, and a bucket of level `i` spans `slots ** i` ticks. Buckets
+    are dynamic linked lists of `DoubleNode`s, so scheduling appends a node and cancelling
+    unlinks it through its handle, both in O(1). When the lower level wraps around, the
+    matching bucket of the level above is cascaded down.
+    '''
+
+    def __init__(self, tick: float = 0.001, slots: int = 256, levels: int = 4, start: float = 0.0) -> None:
+        '''
+        Initializes an empty timing wheel.
+
+        Parameters:
+            tick (float): Resolution of the wheel, in the time unit used by `advance`.
+            slots (int): Number of buckets per level.
+            levels (int): Number of levels; later deadlines are cascaded until they fit.
+            start (float): Current time of the wheel.
+        '''
+        self._tick = tick
+        self._slots = slots
+        self._spans = [slots ** level for level in range(levels)]
+        self._wheels = [[DynamicList() for _ in range(slots)] for _ in range(levels)]
+        self._current = floor(start / tick)
+        self._count = 0
+
+    @property
+    def tick(self) -> float:
+        '''Getter method for the tick attribute.'''
+        return self._tick
+
+    @property
+    def time(self) -> float:
+        '''Getter method for the current time of the wheel.'''
+        return self._current * self._tick
+
+    @property
+    def size(self) -> int:
+        '''Getter method for the number of scheduled timers.'''
+        return self._count
+
+    def is_empty(self) -> bool:
+        '''Checks if no timer is scheduled.'''
+        return self._count == 0
+
+    def _place(self, handle: TimerHandle, earliest: int) -> None:
+        '''
+        Internal method to link a timer into the bucket matching its remaining ticks.
+
+        Overdue timers go to the bucket of the `earliest` tick: the current one while cascading,
+        since it is expired right after, and the next one otherwise.
+        '''
+        deadline = max(handle._deadline, earliest)
+        ticks = deadline - self._current
+        level = len(self._spans) - 1
+        for candidate, span in enumerate(self._spans):
+            if ticks < span * self._slots:
+                level = candidate
+                break
+        bucket = self._wheels[level][(deadline // self._spans[level]) % self._slots]
+        bucket._add_last(handle)
+        handle._bucket = bucket
+        handle._node = bucket._tail
+
+    def _schedule_tick(self, deadline: int, item: object) -> TimerHandle:
+        '''Internal method to schedule an item to expire at the given tick.'''
+        handle = TimerHandle(self, deadline, item)
+        self._place(handle, self._current + 1)
+        self._count += 1
+        return handle
+
+    def schedule_at(self, when: float, item: object) -> TimerHandle:
+        '''Schedules an item to expire at the given time, returning its handle.'''
+        return self._schedule_tick(floor(when / self._tick), item)
+
+    def schedule(self, delay: float, item: object) -> TimerHandle:
+        '''Schedules an item to expire after the given delay, returning its handle.'''
+        return self._schedule_tick(self._current + floor(delay / self._tick), item)
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        '''Cancels a timer in O(1), returning False if it already expired or was cancelled.'''
+        if handle._bucket is None:
+            return False
+
+        handle._bucket._unlink(handle._node)
+        handle._bucket = handle._node = None
+        self._count -= 1
+        return True
+
+    @staticmethod
+    def _drain(bucket: DynamicList) -> DoubleNode:
+        '''
+        Internal method to detach every node of a bucket, returning the first one.
+
+        Callers unlink each node while walking the chain, so drained nodes are freed by
+        reference counting instead of being left as cyclic garbage.
+        '''
+        node = bucket._head
+        bucket._head = bucket._tail = None
+        bucket._size = 0
+        bucket._version += 1
+        return node
+
+    def _cascade(self, level: int) -> None:
+        '''Internal method to move the current bucket of a level to the levels below.'''
+        bucket = self._wheels[level][(self._current // self._spans[level]) % self._slots]
+        node = self._drain(bucket)
+        while node is not None:
+            next_node = node.next
+            node.prev = node.next = None
+            self._place(node.data, self._current)
+            node = next_node
+
+    def _expire(self, expired: List[object]) -> None:
+        '''Internal method to collect the items of the current bucket of the lowest level.'''
+        bucket = self._wheels[0][self._current % self._slots]
+        node = self._drain(bucket)
+        while node is not None:
+            next_node = node.next
+            node.prev = node.next = None
+            handle = node.data
+            if handle._deadline <= self._current:
+                handle._bucket = handle._node = None
+                self._count -= 1
+                expired.append(handle._item)
+            else:
+                self._place(handle, self._current + 1)
+            node = next_node
+
+    def advance(self, now: float) -> List[object]:
+        '''Moves the wheel forward to the given time and returns the items that expired.'''
+        target = floor(now / self._tick)
+        expired = []
+        while self._current < target:
+            if self._count == 0:
+                self._current = target
+                break
+            self._current += 1
+            for level in range(len(self._spans) - 1, 0, -1):
+                if self._current % self._spans[level] == 0:
+                    self._cascade(level)
+            self._expire(expired)
+        return expired
@@ -0,0 +1,346 @@
+from os import fsync, makedirs, path, replace
+from typing import Callable, Dict, Iterator, List, Tuple
+import json
+
+from .expiring import ExpiringQueue
+from .list import LinkedList, DynamicList
+from .queue import LinkedQueue
+from .stack import LinkedStack
+
+
+class InvalidFsyncPolicy(ValueError):
+    '''Exception raised for an unknown fsync policy.'''
+
+    def __init__(self, message: str = 'Fsync policy must be always, commit or never') -> None:
+        super().__init__(message)
+
+
+class WriteAheadLog:
+    '''
+    Class representing an append-only log of operations, one JSON record per line.
+
+    Records are buffered and committed in groups of `group_size`. The fsync policy decides when
+    committed records are forced to disk: after every record (`always`), after every group
+    commit (`commit`), or never, leaving it to the operating system (`never`).
+    '''
+
+    FSYNC_POLICIES = ('always', 'commit', 'never')
+    BUFFER_SIZE = 1 << 16
+
+    def __init__(self, file_path: str, group_size: int = 1, fsync_policy: str = 'commit') -> None:
+        '''
+        Opens a log for appending.
+
+        Raises:
+            InvalidFsyncPolicy: If the fsync policy is unknown.
+        '''
+        if fsync_policy not in self.FSYNC_POLICIES:
+            raise InvalidFsyncPolicy()
+
+        self._file_path = file_path
+        self._group_size = 1 if (fsync_policy == 'always') else group_size
+        self._fsync_policy = fsync_policy
+        self._pending = 0
+        self._file = open(file_path, 'a', encoding='utf-8', buffering=self.BUFFER_SIZE)
+
+    @staticmethod
+    def encode(lsn: int, operation: str, args: list, kwargs: Dict[str, object]) -> str:
+        '''
+        Serializes an operation into a record line.
+
+        Raises:
+            TypeError: If an argument cannot be serialized to JSON.
+        '''
+        return json.dumps([lsn, operation, args, kwargs]) + '\n'
+
+    def append(self, record: str) -> None:
+        '''Appends an encoded record, committing once a full group is pending.'''
+        self._file.write(record)
+        self._pending += 1
+        if self._pending >= self._group_size:
+            self.commit()
+
+    def commit(self) -> None:
+        '''Writes the pending records to the file, syncing them unless the policy is never.'''
+        self._file.flush()
+        if self._fsync_policy != 'never':
+            fsync(self._file.fileno())
+        self._pending = 0
+
+    def truncate(self) -> None:
+        '''Discards every record of the log.'''
+        self._file.close()
+        self._file = open(self._file_path, 'w', encoding='utf-8', buffering=self.BUFFER_SIZE)
+        self._pending = 0
+
+    def close(self) -> None:
+        '''Commits the pending records and closes the log.'''
+        if not self._file.closed:
+            self.commit()
+            self._file.close()
+
+    @staticmethod
+    def replay(file_path: str) -> Iterator[Tuple[int, str, list, Dict[str, object]]]:
+        '''Yields the records of a log, stopping at a record torn by a crash.'''
+        if not path.exists(file_path):
+            return
+        with open(file_path, 'r', encoding='utf-8') as log_file:
+            for line in log_file:
+                try:
+                    lsn, operation, args, kwargs = json.loads(line)
+                except ValueError:
+                    return
+                yield lsn, operation, args, kwargs
+
+
+class DurableStructure:
+    '''
+    Class representing a list, queue or stack whose changes are recorded in a write-ahead log.
+
+    Every mutating entry point of the structure, including the sequence protocol of lists and
+    `drain` of queues, is applied and then appended to the log, so a checkpoint costs as much as
+    the changes since the previous one. Loading JSON rewrites the snapshot instead. Every
+    `compact_every` records the structure is written to a snapshot and the log is truncated.
+    Other attributes are forwarded to the structure; changes made through `structure` directly
+    are not logged.
+    '''
+
+    SNAPSHOT_FILE = 'snapshot.json'
+    LOG_FILE = 'wal.log'
+    OPERATIONS = (
+        (LinkedList, (
+            'add_first', 'add_last', 'insert', 'remove', 'remove_first', 'remove_last', 'assign_iterable',
+            'clear', 'append', 'extend', 'pop', '__setitem__', '__delitem__',
+        )),
+        (LinkedQueue, ('enqueue', 'dequeue', 'drain', 'clear')),
+        (LinkedStack, ('push', 'pop', 'clear')),
+    )
+    UNSUPPORTED = (ExpiringQueue,)
+    RELOADS = ('load_json', 'loads_json')
+
+    def __init__(
+        self, structure: object, directory: str, group_size: int = 1,
+        fsync_policy: str = 'commit', compact_every: int = None, lsn: int = 0
+    ) -> None:
+        '''
+        Starts logging the changes of a structure, writing its current content as snapshot.
+
+        Parameters:
+            structure (object): Linked list, queue or stack to make durable.
+            directory (str): Folder holding the snapshot and the log.
+            group_size (int): Number of records committed together.
+            fsync_policy (str): One of `always`, `commit` or `never`.
+            compact_every (int): Number of records after which to compact, None to never do it.
+            lsn (int): Sequence number of the last change already applied to the structure.
+
+        Raises:
+            TypeError: If the structure is not a linked list, queue or stack, or is an expiring
+                queue, whose deadlines and delayed items cannot be snapshotted or replayed.
+        '''
+        supported = [operations for cls, operations in self.OPERATIONS if isinstance(structure, cls)]
+        if isinstance(structure, self.UNSUPPORTED):
+            raise TypeError(f'{type(structure).__name__!r} depends on a clock and cannot be made durable')
+        if not supported:
+            raise TypeError(f'{type(structure).__name__!r} is not a linked list, queue or stack')
+
+        makedirs(directory, exist_ok=True)
+        self._structure = structure
+        self._operations = supported[0]
+        self._directory = directory
+        self._compact_every = compact_every
+        self._lsn = lsn
+        self._records = 0
+        self._log = WriteAheadLog(path.join(directory, self.LOG_FILE), group_size, fsync_policy)
+        self.compact()
+
+    @property
+    def structure(self) -> object:
+        '''Getter method for the structure attribute.'''
+        return self._structure
+
+    @staticmethod
+    def _items(structure: object) -> List[object]:
+        '''Internal method to return the items of a structure in the order they are restored.'''
+        items = list(structure)
+        if isinstance(structure, LinkedStack):
+            items.reverse()
+        return items
+
+    @staticmethod
+    def _restore(structure: object, items: List[object]) -> None:
+        '''Internal method to add snapshot items to an empty structure.'''
+        if isinstance(structure, LinkedList):
+            add = structure.add_last
+        elif isinstance(structure, LinkedQueue):
+            add = structure.enqueue
+        else:
+            add = structure.push
+        for item in items:
+            add(item)
+
+    def compact(self) -> None:
+        '''Writes the structure to a snapshot atomically and truncates the log.'''
+        self._log.commit()
+        snapshot_path = path.join(self._directory, self.SNAPSHOT_FILE)
+        temp_path = f'{snapshot_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as snapshot_file:
+            json.dump({'lsn': self._lsn, 'items': self._items(self._structure)}, snapshot_file)
+            snapshot_file.flush()
+            fsync(snapshot_file.fileno())
+        replace(temp_path, snapshot_path)
+        self._log.truncate()
+        self._records = 0
+
+    def commit(self) -> None:
+        '''Commits the records of a pending group.'''
+        self._log.commit()
+
+    def close(self) -> None:
+        '''Commits the pending records and closes the log.'''
+        self._log.close()
+
+    @staticmethod
+    def _prepare(operation: str, args: tuple) -> Tuple[list, list]:
+        '''
+        Internal method to return the arguments to apply and to record for an operation.
+
+        Iterables are materialized once so both sides see the same values, and slices are
+        recorded as `{"slice": [start, stop, step]}`.
+        '''
+        apply_args = list(args)
+        if operation == 'extend' or (operation == '__setitem__' and isinstance(args[0], slice)):
+            apply_args[-1] = list(apply_args[-1])
+        record_args = list(apply_args)
+        if operation == 'assign_iterable':
+            record_args[0] = list(record_args[0])
+        if operation in ('__setitem__', '__delitem__') and isinstance(args[0], slice):
+            record_args[0] = {'slice': [args[0].start, args[0].stop, args[0].step]}
+        return apply_args, record_args
+
+    @staticmethod
+    def _decode(operation: str, args: list) -> list:
+        '''Internal method to rebuild the slices of recorded arguments.'''
+        if operation in ('__setitem__', '__delitem__') and isinstance(args[0], dict):
+            args[0] = slice(*args[0]['slice'])
+        return args
+
+    def _reloaded(self, method: Callable) -> Callable:
+        '''Internal method to wrap a JSON load so the snapshot is rewritten once applied.'''
+        def reloaded(*args, **kwargs):
+            result = method(*args, **kwargs)
+            self._lsn += 1
+            self.compact()
+            return result
+        return reloaded
+
+    def _operation(self, name: str) -> Callable:
+        '''
+        Internal method to return a mutating operation of the structure wrapped for logging.
+
+        Raises:
+            TypeError: If the structure does not support the operation.
+        '''
+        if name not in self._operations:
+            raise TypeError(f'{type(self._structure).__name__!r} does not support {name}')
+        return self._logged(name, getattr(self._structure, name))
+
+    def _logged(self, operation: str, method: Callable) -> Callable:
+        '''
+        Internal method to wrap a mutating operation so it is recorded once applied.
+
+        The record is serialized before the operation runs, so arguments that are not valid JSON
+        are rejected without touching the structure. If the operation fails after a partial
+        change, the snapshot is rewritten so the log never diverges from the structure.
+        '''
+        def logged(*args, **kwargs):
+            apply_args, record_args = self._prepare(operation, args)
+            record = WriteAheadLog.encode(self._lsn + 1, operation, record_args, kwargs)
+            version = self._structure._version
+            try:
+                result = method(*apply_args, **kwargs)
+            except Exception:
+                if self._structure._version != version:
+                    self.compact()
+                raise
+            self._lsn += 1
+            self._log.append(record)
+            self._records += 1
+            if self._compact_every is not None and self._records >= self._compact_every:
+                self.compact()
+            return result
+        return logged
+
+    @classmethod
+    def recover(cls, directory: str, factory: Callable[[], object] = DynamicList, **options) -> 'DurableStructure':
+        '''
+        Rebuilds a structure from the snapshot and log of a directory and resumes logging.
+
+        Parameters:
+            directory (str): Folder holding the snapshot and the log.
+            factory (Callable): Function creating an empty structure of the logged type.
+            options: Keyword arguments passed to the constructor, such as `fsync_policy`.
+        '''
+        structure = factory()
+        lsn = 0
+        snapshot_path = path.join(directory, cls.SNAPSHOT_FILE)
+        if path.exists(snapshot_path):
+            with open(snapshot_path, 'r', encoding='utf-8') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            cls._restore(structure, snapshot['items'])
+            lsn = snapshot['lsn']
+
+        for record_lsn, operation, args, kwargs in WriteAheadLog.replay(path.join(directory, cls.LOG_FILE)):
+            if record_lsn > lsn:
+                getattr(structure, operation)(*cls._decode(operation, args), **kwargs)
+                lsn = record_lsn
+        return cls(structure, directory, lsn=lsn, **options)
+
+    def __getattr__(self, name: str) -> object:
+        '''Forwards attributes to the structure, recording its mutating operations.'''
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        attribute = getattr(self._structure, name)
+        if name in self._operations:
+            return self._logged(name, attribute)
+        if name in self.RELOADS:
+            return self._reloaded(attribute)
+        return attribute
+
+    def __len__(self) -> int:
+        '''Returns the number of elements of the structure.'''
+        return len(self._structure)
+
+    def __getitem__(self, index: object) -> object:
+        '''Returns the data at the given index or slice of the structure.'''
+        return self._structure[index]
+
+    def __setitem__(self, index: object, data: object) -> None:
+        '''Replaces the data at the given index or slice, recording the change.'''
+        self._operation('__setitem__')(index, data)
+
+    def __delitem__(self, index: object) -> None:
+        '''Removes the data at the given index or slice, recording the change.'''
+        self._operation('__delitem__')(index)
+
+    def __iadd__(self, values: object) -> 'DurableStructure':
+        '''Extends the structure in place, recording the change.'''
+        self._operation('extend')(values)
+        return self
+
+    def __iter__(self) -> Iterator[object]:
+        '''Iterator method forwarding to the structure.'''
+        return iter(self._structure)
+
+    def __enter__(self) -> 'DurableStructure':
+        '''Returns the durable structure for use as a context manager.'''
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        '''Closes the log.'''
+        self.close()
+
+
+def recover(directory: str, factory: Callable[[], object] = DynamicList, **options) -> DurableStructure:
+    '''Rebuilds a durable structure from the snapshot and log of a directory.'''
+    return DurableStructure.recover(directory, factory, **options)
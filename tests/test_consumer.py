@@ -0,0 +1,75 @@
+from pytest import fixture, raises
+from threading import Lock
+from typing import List
+import asyncio
+
+from src.linkeds import BatchConsumer, DynamicQueue, TokenBucket
+
+
+EVENTS = tuple(f'event-{i}' for i in range(250))
+
+
+@fixture
+def dynamic_queue() -> DynamicQueue:
+    queue = DynamicQueue()
+
+    for event in EVENTS:
+        queue.enqueue(event)
+
+    return queue
+
+
+def test_drain(dynamic_queue: DynamicQueue) -> None:
+    assert dynamic_queue.drain(3) == list(EVENTS[:3])
+    assert dynamic_queue.size == len(EVENTS) - 3
+    assert dynamic_queue.drain() == list(EVENTS[3:])
+    assert dynamic_queue.is_empty() is True
+    assert dynamic_queue.drain(5) == []
+
+    dynamic_queue.enqueue(EVENTS[0])
+    with raises(ValueError):
+        dynamic_queue.drain(-1)
+    assert dynamic_queue.size == 1 and list(dynamic_queue) == [EVENTS[0]]
+    with raises(ValueError):
+        BatchConsumer(dynamic_queue, print, max_batch=0)
+
+
+def test_batch_consumer(dynamic_queue: DynamicQueue) -> None:
+    batches: List[List[str]] = []
+    lock = Lock()
+    consumer = BatchConsumer(dynamic_queue, batches.append, max_batch=100, max_wait=0.01, lock=lock)
+
+    consumer.start()
+    with lock:
+        dynamic_queue.enqueue('late-event')
+    consumer.stop()
+
+    assert [event for batch in batches for event in batch] == list(EVENTS) + ['late-event']
+    assert consumer.stats()['batch_sizes'][100] == 2
+    assert consumer.stats()['items'] == len(EVENTS) + 1
+
+
+def test_batch_consumer_async(dynamic_queue: DynamicQueue) -> None:
+    batches: List[List[str]] = []
+
+    async def sink(batch: List[str]) -> None:
+        batches.append(batch)
+
+    consumer = BatchConsumer(dynamic_queue, sink, max_batch=64, max_wait=0.01)
+
+    async def consume() -> None:
+        while await consumer.run_once_async():
+            pass
+
+    asyncio.run(consume())
+    assert [len(batch) for batch in batches] == [64, 64, 64, 58]
+
+
+def test_token_bucket() -> None:
+    now = [0.0]
+    bucket = TokenBucket(rate=10, capacity=5, clock=lambda: now[0])
+
+    assert bucket.consume(5) == 0.0
+    assert bucket.consume(2) == 0.2
+    now[0] = 1.0
+    assert bucket.consume(3) == 0.0
@@ -0,0 +1,91 @@
+from pytest import fixture, raises
+
+from src.linkeds import EmptyQueue, ExpiringQueue
+
+
+SESSIONS = (
+    'alice', 'bob', 'carol', 'dave', 'erin', 'frank', 'grace', 'heidi'
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@fixture
+def expiring_queue(clock: Clock) -> ExpiringQueue:
+    queue = ExpiringQueue(ttl=10, clock=clock)
+
+    for session in SESSIONS:
+        queue.enqueue(session)
+        clock.now += 1
+
+    return queue
+
+
+def test_expiring_queue(expiring_queue: ExpiringQueue, clock: Clock) -> None:
+    assert expiring_queue.size == len(SESSIONS)
+
+    clock.now = 12
+    assert expiring_queue.peek() == SESSIONS[3]
+    assert expiring_queue.expired == 3
+    assert tuple(expiring_queue) == SESSIONS[3:]
+    assert expiring_queue.dequeue() == SESSIONS[3]
+
+    expiring_queue.enqueue('ivan', ttl=1)
+    clock.now = 14
+    assert tuple(expiring_queue.snapshot_iter()) == SESSIONS[5:] + ('ivan',)
+
+    clock.now = 20
+    with raises(EmptyQueue):
+        expiring_queue.dequeue()
+    assert expiring_queue.expired == len(SESSIONS)
+
+
+def test_delayed_delivery(clock: Clock) -> None:
+    queue = ExpiringQueue(clock=clock)
+    queue.enqueue('retry-2', delay=5)
+    queue.enqueue('retry-1', delay=2)
+    queue.enqueue('now')
+
+    assert queue.delayed == 2
+    assert queue.dequeue() == 'now'
+    assert queue.peek() is None
+
+    clock.now = 5
+    assert queue.dequeue() == 'retry-1'
+    assert queue.dequeue() == 'retry-2'
+
+    queue.enqueue('late', ttl=1, delay=1)
+    clock.now = 7
+    with raises(EmptyQueue):
+        queue.dequeue()
+    assert queue.expired == 1
+
+
+def test_drain_with_ticking_clock(clock: Clock) -> None:
+    queue = ExpiringQueue(ttl=1, clock=clock)
+    for session in SESSIONS[:3]:
+        queue.enqueue(session)
+
+    def tick() -> float:
+        clock.now += 0.6
+        return clock.now
+
+    queue._clock = tick
+    assert queue.drain() == list(SESSIONS[:3])
+    assert queue.drain() == []
+
+    queue.enqueue('expired')
+    clock.now += 5
+    assert queue.drain(1) == []
+    assert queue.expired == 1
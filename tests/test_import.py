@@ -0,0 +1,41 @@
+from os import path
+import subprocess
+import sys
+
+
+ROOT_FOLDER = path.abspath(path.join(path.dirname(__file__), '..'))
+IMPORT_BUDGET_US = 20_000
+
+
+def import_times(statement: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT_FOLDER, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def test_lazy_import() -> None:
+    startup = {name.strip() for name in import_times('pass')}
+    times = import_times('from src.linkeds import DynamicStack')
+    modules = {name.strip() for name in times} - startup
+
+    assert {'src.linkeds.node', 'src.linkeds.stack'} <= modules
+    assert not modules & {'src.linkeds.list', 'src.linkeds.jsonifier', 'json', 'typing'}
+
+    top_level = sum(cumulative for name, cumulative in times.items() if name.startswith('src'))
+    assert top_level < IMPORT_BUDGET_US
+
+
+def test_public_names() -> None:
+    import src.linkeds as linkeds
+
+    assert 'DynamicList' in dir(linkeds)
+    for name in linkeds.__all__:
+        assert getattr(linkeds, name) is not None
@@ -1,8 +1,10 @@
-from os import path, mkdir
-from pytest import fixture
+from collections.abc import MutableSequence, Sequence
+from os import listdir, path, mkdir, remove, stat, umask
+from pytest import fixture, raises
+import gc
 import json
 
-from src.linkeds import BoundedList, DynamicList
+from src.linkeds import BoundedList, ConcurrentListModification, DynamicList, FullList
 
 
 GAMES = (
@@ -13,6 +15,7 @@ GAMES = (
 )
 OUTPUT_FOLDER = path.abspath(path.join(path.dirname(__file__), 'output'))
 DYNAMIC_LIST_JSON = path.join(OUTPUT_FOLDER, 'dynamic_list.json')
+DYNAMIC_LIST_TXT = path.join(OUTPUT_FOLDER, 'dynamic_list.txt')
 
 
 @fixture
@@ -103,3 +106,126 @@ def test_dynamic_list(dynamic_list: DynamicList) -> None:
             assert dynamic_list.remove(idx) == GAMES[idx]
 
     assert dynamic_list.is_empty() is True
+
+
+def test_sequence_protocol(dynamic_list: DynamicList) -> None:
+    games = list(GAMES)
+
+    assert len(dynamic_list) == len(games)
+    assert GAMES[3] in dynamic_list
+    assert dynamic_list[-1] == games[-1]
+    assert dynamic_list[2:9:3].to_list() == games[2:9:3]
+    assert dynamic_list[::-2].to_list() == games[::-2]
+    assert list(reversed(dynamic_list)) == games[::-1]
+    assert dynamic_list.index(GAMES[5]) == games.index(GAMES[5])
+
+    dynamic_list[1:4] = ['Tetris']
+    games[1:4] = ['Tetris']
+    assert dynamic_list.to_list() == games
+
+    dynamic_list[::4] = ['Pong'] * len(games[::4])
+    games[::4] = ['Pong'] * len(games[::4])
+    assert dynamic_list.to_list() == games
+
+    del dynamic_list[2:-2:2]
+    del games[2:-2:2]
+    assert dynamic_list.to_list() == games
+    assert dynamic_list.get_last() == games[-1]
+
+    other = DynamicList()
+    other.extend(games)
+    assert dynamic_list == other
+
+    other.append('Tetris')
+    other += ['Pong']
+    assert other.pop() == 'Pong'
+    assert other.pop(0) == games[0]
+    assert other.to_list() == games[1:] + ['Tetris']
+    assert isinstance(other, Sequence) and not isinstance(other, MutableSequence)
+    with raises(TypeError):
+        hash(other)
+
+    bounded_list = BoundedList(2)
+    bounded_list.extend(games[:2])
+    with raises(FullList):
+        bounded_list[0:0] = ['Tetris']
+
+
+def test_fail_fast_iteration(dynamic_list: DynamicList) -> None:
+    with raises(ConcurrentListModification):
+        for _ in dynamic_list:
+            dynamic_list.remove(1)
+
+    snapshot = dynamic_list.snapshot_iter()
+    expected = dynamic_list.to_list()
+    dynamic_list.add_first('Tetris')
+    assert list(snapshot) == expected
+
+
+def test_json_dumps(dynamic_list: DynamicList) -> None:
+    if not path.exists(OUTPUT_FOLDER):
+        mkdir(OUTPUT_FOLDER)
+
+    pretty = dynamic_list.dump_json(DYNAMIC_LIST_JSON)
+    compact = dynamic_list.dump_json(DYNAMIC_LIST_JSON, None, separators=DynamicList.JSON_COMPACT_SEPARATORS)
+    assert compact['bytes'] == len(json.dumps(GAMES, separators=(',', ':')).encode()) < pretty['bytes']
+    assert compact['seconds'] >= 0
+    assert not [name for name in listdir(OUTPUT_FOLDER) if name.startswith('.dynamic_list')]
+
+    if path.exists(DYNAMIC_LIST_TXT):
+        remove(DYNAMIC_LIST_TXT)
+    dynamic_list.dump_json(DYNAMIC_LIST_TXT)
+    current_umask = umask(0)
+    umask(current_umask)
+    assert stat(DYNAMIC_LIST_TXT).st_mode & 0o777 == 0o666 & ~current_umask
+
+    for extension in ('.gz', '.xz'):
+        file_path = f'{DYNAMIC_LIST_JSON}{extension}'
+        assert dynamic_list.dump_json(file_path)['bytes'] < pretty['bytes']
+        loaded = DynamicList()
+        loaded.load_json(file_path)
+        assert loaded.to_tuple() == GAMES
+
+    with raises(TypeError):
+        dynamic_list.add_last(object())
+        dynamic_list.dump_json(DYNAMIC_LIST_JSON)
+    with raises(TypeError):
+        dynamic_list.dump_json(f'{DYNAMIC_LIST_JSON}.gz')
+    assert not [name for name in listdir(OUTPUT_FOLDER) if name.startswith('.dynamic_list')]
+    dynamic_list.remove_last()
+    dynamic_list.load_json(DYNAMIC_LIST_JSON)
+    assert dynamic_list.to_tuple() == GAMES
+
+
+def test_clear(dynamic_list: DynamicList) -> None:
+    nodes = [dynamic_list._head, dynamic_list._tail]
+    dynamic_list.clear()
+    assert dynamic_list.is_empty() is True
+    assert all(node.next is None and node.prev is None for node in nodes)
+
+    dynamic_list.assign_iterable(GAMES)
+    head = dynamic_list._head
+    dynamic_list.assign_iterable(GAMES[:2])
+    assert head.next is None
+    assert dynamic_list.to_tuple() == GAMES[:2]
+
+    weak_list = BoundedList(len(GAMES), weak_prev=True)
+    weak_list.assign_iterable(list(GAMES))
+    del weak_list[3:6]
+    weak_list.insert(3, 'Doom')
+    assert weak_list.reverse().to_tuple() == (GAMES[:3] + ('Doom',) + GAMES[6:])[::-1]
+    assert weak_list[::2]._node_class is weak_list._node_class
+    assert weak_list.reverse()._node_class is weak_list._node_class
+    assert weak_list.reverse()._capacity == weak_list._capacity
+    assert DynamicList(weak_prev=True).reverse()._node_class is weak_list._node_class
+
+    gc.collect()
+    gc.disable()
+    try:
+        weak_list = DynamicList(weak_prev=True)
+        for game in GAMES:
+            weak_list.add_last(game)
+        del weak_list
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
@@ -0,0 +1,79 @@
+from pytest import fixture, raises
+from typing import Dict
+
+from src.linkeds import (
+    BoundedQueue, BoundedStack, CallbackExporter, DynamicList, FullQueue,
+    instrument, is_instrumented, uninstrument
+)
+
+
+CITIES = (
+    'Belo Horizonte', 'Brasilia', 'Curitiba', 'Fortaleza', 'Manaus',
+    'Porto Alegre', 'Recife', 'Rio de Janeiro', 'Salvador', 'Sao Paulo'
+)
+
+
+@fixture
+def dynamic_list() -> DynamicList:
+    lst = instrument(DynamicList())
+
+    for city in CITIES:
+        lst.add_last(city)
+
+    return lst
+
+
+def test_list_metrics(dynamic_list: DynamicList) -> None:
+    dynamic_list.insert(0, 'Natal')
+    dynamic_list.get(3)
+    dynamic_list.get(len(CITIES) - 1)
+    dynamic_list.remove_first()
+    json_str = dynamic_list.dumps_json()
+
+    stats = dynamic_list.stats()
+    assert stats['operations'] == {
+        'add_last': len(CITIES), 'insert': 1, 'get': 2, 'remove_first': 1, 'dumps_json': 1
+    }
+    assert stats['high_water_mark'] == len(CITIES) + 1
+    assert stats['lookups'] == 2
+    assert stats['nodes_traversed'] == 3 + 1
+
+    dynamic_list.get(len(CITIES) // 2)
+    assert dynamic_list.stats()['nodes_traversed'] == 3 + 1 + len(CITIES) // 2
+    assert stats['serialized_bytes'] == len(json_str)
+
+    dynamic_list[:0] = range(100)
+    del dynamic_list[:50]
+    dynamic_list.append('Natal')
+    dynamic_list += ['Belem']
+    dynamic_list.pop()
+    operations = dynamic_list.stats()['operations']
+    assert {name: operations[name] for name in ('__setitem__', '__delitem__', 'append', '__iadd__', 'pop')} == {
+        '__setitem__': 1, '__delitem__': 1, 'append': 1, '__iadd__': 1, 'pop': 1
+    }
+    assert operations['add_last'] == len(CITIES)
+    assert dynamic_list.stats()['high_water_mark'] == len(CITIES) + 100
+
+    assert is_instrumented(dynamic_list.reverse()) is True
+    assert is_instrumented(uninstrument(dynamic_list)) is False
+    assert not hasattr(dynamic_list, 'stats')
+
+
+def test_exporter() -> None:
+    exported: Dict[str, dict] = {}
+    queue = instrument(BoundedQueue(2), CallbackExporter(exported.__setitem__), 'jobs')
+    stack = instrument(BoundedStack(1))
+
+    for city in CITIES[:2]:
+        queue.enqueue(city)
+    with raises(FullQueue):
+        queue.enqueue(CITIES[2])
+    queue.dequeue()
+    queue.export_stats()
+
+    assert exported['jobs']['operations'] == {'enqueue': 2, 'dequeue': 1}
+    assert exported['jobs']['rejected'] == {'enqueue': 1}
+    assert exported['jobs']['high_water_mark'] == 2
+
+    stack.push(CITIES[0])
+    assert stack.stats()['operations'] == {'push': 1}
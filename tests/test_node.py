@@ -1,7 +1,7 @@
 from pytest import fixture
 from typing import List
 
-from src.linkeds import DoubleNode, SingleNode
+from src.linkeds import DoubleNode, SingleNode, WeakDoubleNode
 
 
 NAMES = (
@@ -53,3 +53,18 @@ def test_double_node(double_nodes: List[DoubleNode]) -> None:
         else:
             assert node.prev.data == NAMES[i - 1]
             assert node.next is None
+
+
+def test_weak_double_node() -> None:
+    nodes = [WeakDoubleNode(NAMES[0])]
+
+    for i, node in enumerate(NAMES[1:], start=1):
+        nodes.append(WeakDoubleNode(node, nodes[i - 1]))
+        nodes[i - 1].next = nodes[i]
+
+    for i, node in enumerate(nodes[1:], start=1):
+        assert node.prev is nodes[i - 1]
+
+    last = nodes[-1]
+    del nodes
+    assert last.prev is None
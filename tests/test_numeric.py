@@ -0,0 +1,78 @@
+from os import path, mkdir
+from pytest import fixture, raises
+
+from src.linkeds import EmptyList, InvalidNumericFile, NumericList
+
+
+READINGS = (
+    21.5, 22.0, 19.8, 23.4, 25.1, 24.7, 18.9, 20.3, 26.2, 22.8, 21.1, 19.4, 23.9
+)
+OUTPUT_FOLDER = path.abspath(path.join(path.dirname(__file__), 'output'))
+NUMERIC_LIST_BIN = path.join(OUTPUT_FOLDER, 'numeric_list.bin')
+
+
+@fixture
+def numeric_list() -> NumericList:
+    lst = NumericList(chunk_size=4)
+
+    for i, reading in enumerate(READINGS):
+        if i % 2 == 0:
+            lst.add_last(reading)
+        else:
+            lst.insert(i, reading)
+
+    return lst
+
+
+def test_numeric_list(numeric_list: NumericList) -> None:
+    assert numeric_list.size == len(READINGS)
+    assert numeric_list.to_tuple() == READINGS
+    assert numeric_list.get_first() == READINGS[0]
+    assert numeric_list[-1] == READINGS[-1]
+    assert numeric_list.reverse().to_tuple() == READINGS[::-1]
+
+    assert numeric_list.sum() == sum(READINGS)
+    assert numeric_list.min() == min(READINGS)
+    assert numeric_list.max() == max(READINGS)
+    assert numeric_list.map(round, 'q').to_tuple() == tuple(map(round, READINGS))
+    assert numeric_list > numeric_list.map(lambda reading: reading - 1)
+
+    assert numeric_list.remove(5) == READINGS[5]
+    assert numeric_list.remove_first() == READINGS[0]
+    assert numeric_list.remove_last() == READINGS[-1]
+
+    with raises(EmptyList):
+        NumericList().min()
+
+
+def test_numeric_buffer(numeric_list: NumericList) -> None:
+    if not path.exists(OUTPUT_FOLDER):
+        mkdir(OUTPUT_FOLDER)
+
+    views = list(numeric_list.chunk_views())
+    assert all(view.format == 'd' and len(view) <= 4 for view in views)
+    assert [value for view in views for value in view.tolist()] == list(READINGS)
+
+    views[0][0] = 0.5
+    assert numeric_list.get_first() == 0.5
+    with raises(BufferError):
+        numeric_list.insert(1, 0.0)
+    assert numeric_list.size == len(READINGS)
+    for view in views:
+        view.release()
+    numeric_list.insert(1, 0.0)
+    assert numeric_list.remove(1) == 0.0
+    numeric_list[0] = READINGS[0]
+
+    numeric_list.dump(NUMERIC_LIST_BIN)
+    assert path.getsize(NUMERIC_LIST_BIN) == NumericList.FILE_HEADER.size + 8 * len(READINGS)
+
+    loaded = NumericList('q')
+    loaded.load(NUMERIC_LIST_BIN)
+    assert loaded.typecode == 'd'
+    assert loaded == numeric_list
+
+    with open(NUMERIC_LIST_BIN, 'wb') as binary_file:
+        binary_file.write(b'not a numeric list')
+    with raises(InvalidNumericFile):
+        loaded.load(NUMERIC_LIST_BIN)
@@ -0,0 +1,60 @@
+from pytest import fixture, raises
+from src.linkeds import DynamicStack, EmptyStack, PersistentList, PersistentStack
+
+
+PLANETS = (
+    'Mercury', 'Venus', 'Earth', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune'
+)
+
+
+@fixture
+def persistent_stack() -> PersistentStack:
+    return PersistentStack(PLANETS)
+
+
+@fixture
+def persistent_list() -> PersistentList:
+    return PersistentList(PLANETS)
+
+
+def test_persistent_stack(persistent_stack: PersistentStack) -> None:
+    assert persistent_stack.size == len(PLANETS)
+    assert persistent_stack.peek() == PLANETS[-1]
+
+    pushed = persistent_stack.push('Pluto')
+    popped = persistent_stack.pop()
+    assert pushed.peek() == 'Pluto'
+    assert popped.peek() == PLANETS[-2]
+    assert persistent_stack.to_tuple() == PLANETS[::-1]
+    assert pushed.pop() is not persistent_stack
+    assert pushed.pop() == persistent_stack
+
+    with raises(EmptyStack):
+        PersistentStack().pop()
+
+    dynamic_stack = DynamicStack()
+    for planet in PLANETS:
+        dynamic_stack.push(planet)
+
+    snapshot = PersistentStack.from_stack(dynamic_stack)
+    dynamic_stack.pop()
+    dynamic_stack.push('Pluto')
+    assert snapshot == persistent_stack
+
+
+def test_persistent_list(persistent_list: PersistentList) -> None:
+    assert persistent_list.to_tuple() == PLANETS
+    assert persistent_list.get_first() == PLANETS[0]
+    assert persistent_list[-1] == PLANETS[-1]
+
+    prepended = persistent_list.add_first('Sun')
+    assert prepended.to_tuple() == ('Sun',) + PLANETS
+    assert prepended.remove_first() == persistent_list
+
+    inserted = persistent_list.insert(3, 'Moon')
+    assert inserted.to_tuple() == PLANETS[:3] + ('Moon',) + PLANETS[3:]
+    assert inserted.remove(3) == persistent_list
+    assert persistent_list.replace(0, 'Vulcan').get(0) == 'Vulcan'
+    assert persistent_list.add_last('Pluto').to_tuple() == PLANETS + ('Pluto',)
+    assert persistent_list.reverse().to_tuple() == PLANETS[::-1]
+    assert persistent_list.to_tuple() == PLANETS
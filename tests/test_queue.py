@@ -1,5 +1,5 @@
-from pytest import fixture
-from src.linkeds import BoundedQueue, DynamicQueue
+from pytest import fixture, raises
+from src.linkeds import BoundedQueue, ConcurrentQueueModification, DynamicQueue
 
 
 COMPONENTS = (
@@ -49,3 +49,29 @@ def test_dynamic_queue(dynamic_queue: DynamicQueue) -> None:
         assert dynamic_queue.dequeue() == COMPONENTS[i]
 
     assert dynamic_queue.is_empty() is True
+
+
+def test_fail_fast_iteration(dynamic_queue: DynamicQueue) -> None:
+    assert tuple(dynamic_queue) == COMPONENTS
+
+    with raises(ConcurrentQueueModification):
+        for component in dynamic_queue:
+            dynamic_queue.enqueue(component)
+
+    snapshot = dynamic_queue.snapshot_iter()
+    expected = tuple(dynamic_queue)
+    dynamic_queue.dequeue()
+    dynamic_queue.enqueue('Kernel')
+    assert tuple(snapshot) == expected
+
+
+def test_clear(dynamic_queue: DynamicQueue) -> None:
+    snapshot = dynamic_queue.snapshot_iter()
+    expected = tuple(dynamic_queue)
+    dynamic_queue.clear()
+    assert dynamic_queue.is_empty() is True
+    assert tuple(dynamic_queue) == ()
+    assert tuple(snapshot) == expected
+
+    dynamic_queue.enqueue('Kernel')
+    assert dynamic_queue.size == 1
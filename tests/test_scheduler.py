@@ -0,0 +1,54 @@
+from pytest import fixture, raises
+from typing import Iterator
+
+from src.linkeds import EmptyDeque, WorkStealingDeque, WorkStealingScheduler
+
+
+TASKS = (
+    'Parse', 'Validate', 'Transform', 'Compress', 'Encrypt', 'Upload', 'Notify'
+)
+
+
+@fixture
+def work_stealing_deque() -> WorkStealingDeque:
+    deque = WorkStealingDeque()
+
+    for task in TASKS:
+        deque.push(task)
+
+    return deque
+
+
+@fixture
+def scheduler() -> Iterator[WorkStealingScheduler]:
+    with WorkStealingScheduler(workers=4) as scheduler:
+        yield scheduler
+
+
+def test_work_stealing_deque(work_stealing_deque: WorkStealingDeque) -> None:
+    assert work_stealing_deque.size == len(TASKS)
+    assert work_stealing_deque.pop() == TASKS[-1]
+    assert work_stealing_deque.steal() == TASKS[0]
+
+    while not work_stealing_deque.is_empty():
+        work_stealing_deque.pop()
+
+    with raises(EmptyDeque):
+        work_stealing_deque.steal()
+
+
+def test_work_stealing_scheduler(scheduler: WorkStealingScheduler) -> None:
+    def fibonacci(n: int) -> int:
+        if n < 2:
+            return n
+        left = scheduler.fork(fibonacci, n - 1)
+        right = fibonacci(n - 2)
+        return scheduler.join(left) + right
+
+    assert scheduler.join(scheduler.submit(fibonacci, 15)) == 610
+
+    futures = [scheduler.submit(len, task) for task in TASKS]
+    assert [future.result() for future in futures] == [len(task) for task in TASKS]
+
+    with raises(ZeroDivisionError):
+        scheduler.submit(divmod, 1, 0).result()
@@ -0,0 +1,52 @@
+from os import listdir, path
+from pytest import fixture, raises
+from shutil import rmtree
+
+from src.linkeds import EmptyQueue, SpillingQueue
+
+
+ORDERS = tuple({'id': i, 'total': i * 10.5} for i in range(25))
+OUTPUT_FOLDER = path.abspath(path.join(path.dirname(__file__), 'output'))
+SPILL_FOLDER = path.join(OUTPUT_FOLDER, 'spill')
+
+
+@fixture
+def spilling_queue() -> SpillingQueue:
+    rmtree(SPILL_FOLDER, ignore_errors=True)
+    queue = SpillingQueue(SPILL_FOLDER, memory_limit=5, segment_size=4)
+
+    for order in ORDERS:
+        queue.enqueue(order)
+
+    return queue
+
+
+def test_spilling_queue(spilling_queue: SpillingQueue) -> None:
+    assert spilling_queue.size == len(ORDERS)
+    assert spilling_queue.spilled == 20
+    assert len(listdir(SPILL_FOLDER)) == 5
+
+    for order in ORDERS[:12]:
+        assert spilling_queue.peek() == order
+        assert spilling_queue.dequeue() == order
+
+    spilling_queue.close()
+
+    reopened = SpillingQueue(SPILL_FOLDER, memory_limit=5, segment_size=4)
+    assert reopened.size == len(ORDERS) - 12
+    for order in ORDERS[12:]:
+        assert reopened.dequeue() == order
+
+    with raises(EmptyQueue):
+        reopened.dequeue()
+    assert listdir(SPILL_FOLDER) == []
+
+
+def test_clear(spilling_queue: SpillingQueue) -> None:
+    spilling_queue.dequeue()
+    spilling_queue.clear()
+    assert spilling_queue.is_empty() is True
+    assert listdir(SPILL_FOLDER) == []
+
+    spilling_queue.enqueue(ORDERS[0])
+    assert spilling_queue.dequeue() == ORDERS[0]
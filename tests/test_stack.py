@@ -1,5 +1,5 @@
-from pytest import fixture
-from src.linkeds import BoundedStack, DynamicStack
+from pytest import fixture, raises
+from src.linkeds import BoundedStack, ConcurrentStackModification, DynamicStack
 
 
 PROCESSES = (
@@ -47,3 +47,29 @@ def test_dynamic_stack(dynamic_stack: DynamicStack) -> None:
         assert dynamic_stack.pop() == PROCESSES[-(i + 1)]
 
     assert dynamic_stack.is_empty() is True
+
+
+def test_fail_fast_iteration(dynamic_stack: DynamicStack) -> None:
+    assert tuple(dynamic_stack) == PROCESSES[::-1]
+
+    with raises(ConcurrentStackModification):
+        for _ in dynamic_stack:
+            dynamic_stack.pop()
+
+    snapshot = dynamic_stack.snapshot_iter()
+    expected = tuple(dynamic_stack)
+    dynamic_stack.pop()
+    dynamic_stack.push('Shell')
+    assert tuple(snapshot) == expected
+
+
+def test_clear(dynamic_stack: DynamicStack) -> None:
+    snapshot = dynamic_stack.snapshot_iter()
+    expected = tuple(dynamic_stack)
+    dynamic_stack.clear()
+    assert dynamic_stack.is_empty() is True
+    assert tuple(dynamic_stack) == ()
+    assert tuple(snapshot) == expected
+
+    dynamic_stack.push('Shell')
+    assert dynamic_stack.size == 1
@@ -0,0 +1,60 @@
+from pytest import fixture
+from threading import Thread
+
+from src.linkeds import ConcurrentList, ReadWriteLock
+
+
+LANGUAGES = (
+    'C', 'C++', 'Go', 'Haskell', 'Java', 'JavaScript', 'Kotlin', 'Python', 'Ruby', 'Rust'
+)
+
+
+@fixture
+def concurrent_list() -> ConcurrentList:
+    lst = ConcurrentList()
+
+    for language in LANGUAGES:
+        lst.add_last(language)
+
+    return lst
+
+
+def test_read_write_lock() -> None:
+    lock = ReadWriteLock()
+
+    assert lock.acquire_read() is True
+    assert lock.acquire_read(blocking=False) is True
+    assert lock.acquire_write(blocking=False) is False
+    lock.release_read()
+    lock.release_read()
+
+    assert lock.acquire_write(blocking=False) is True
+    assert lock.acquire_read(blocking=False) is False
+    lock.release_write()
+
+
+def test_concurrent_list(concurrent_list: ConcurrentList) -> None:
+    assert concurrent_list.size == len(LANGUAGES)
+    assert concurrent_list.get_first() == LANGUAGES[0]
+    assert tuple(concurrent_list) == LANGUAGES
+
+    def write() -> None:
+        for i in range(100):
+            concurrent_list.add_last(i)
+            concurrent_list.remove_last()
+
+    threads = [Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with concurrent_list.transaction() as lst:
+        lst.add_first('Ada')
+        lst.remove_last()
+
+    assert concurrent_list.to_tuple() == ('Ada',) + LANGUAGES[:-1]
+
+    stats = concurrent_list.stats()
+    assert stats['add_last']['calls'] == len(LANGUAGES) + 400
+    assert stats['transaction']['calls'] == 1
@@ -0,0 +1,55 @@
+from pytest import fixture
+from typing import List
+import gc
+
+from src.linkeds import TimerHandle, TimingWheel
+
+
+CONNECTIONS = (
+    'db-primary', 'db-replica', 'cache', 'search', 'queue', 'mailer', 'payments', 'auth'
+)
+
+
+@fixture
+def timing_wheel() -> TimingWheel:
+    return TimingWheel(tick=1, slots=4, levels=3)
+
+
+@fixture
+def timers(timing_wheel: TimingWheel) -> List[TimerHandle]:
+    return [timing_wheel.schedule(10 * (i + 1), connection) for i, connection in enumerate(CONNECTIONS)]
+
+
+def test_timing_wheel(timing_wheel: TimingWheel, timers: List[TimerHandle]) -> None:
+    assert timing_wheel.size == len(CONNECTIONS)
+    assert timers[2].deadline == 30
+
+    assert timers[1].cancel() is True
+    assert timers[1].cancel() is False
+    assert timers[1].is_active() is False
+
+    assert timing_wheel.advance(9) == []
+    assert timing_wheel.advance(30) == [CONNECTIONS[0], CONNECTIONS[2]]
+    assert timers[0].is_active() is False
+
+    timing_wheel.schedule(0, 'overdue')
+    assert timing_wheel.advance(31) == ['overdue']
+
+    for timer in timers[3:6]:
+        timer.cancel()
+    assert timing_wheel.advance(1_000) == list(CONNECTIONS[6:])
+    assert timing_wheel.is_empty() is True
+    assert timing_wheel.time == 1_000
+
+
+def test_expired_nodes_are_not_cyclic() -> None:
+    gc.collect()
+    gc.disable()
+    try:
+        wheel = TimingWheel(tick=1, slots=8, levels=2)
+        for i in range(1_000):
+            wheel.schedule(i % 50, i)
+        assert len(wheel.advance(100)) == 1_000
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
@@ -0,0 +1,125 @@
+from os import path
+from pytest import fixture, raises
+from shutil import rmtree
+
+from src.linkeds import (
+    BoundedList, DurableStructure, DynamicList, DynamicQueue, DynamicStack, ExpiringQueue, FullList,
+    InvalidFsyncPolicy, NumericList, recover
+)
+
+
+ACCOUNTS = tuple({'id': i, 'balance': i * 100} for i in range(10))
+OUTPUT_FOLDER = path.abspath(path.join(path.dirname(__file__), 'output'))
+WAL_FOLDER = path.join(OUTPUT_FOLDER, 'wal')
+
+
+@fixture
+def durable_list() -> DurableStructure:
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    durable = DurableStructure(DynamicList(), WAL_FOLDER, group_size=3)
+
+    for account in ACCOUNTS:
+        durable.add_last(account)
+
+    return durable
+
+
+def test_recover(durable_list: DurableStructure) -> None:
+    durable_list.add_first('head')
+    durable_list.insert(5, 'middle')
+    durable_list.remove(1)
+    durable_list.remove_last()
+    expected = durable_list.to_list()
+    durable_list.close()
+
+    recovered = recover(WAL_FOLDER, DynamicList)
+    assert recovered.to_list() == expected
+    assert recovered.structure is not durable_list.structure
+    recovered.close()
+
+
+def test_compaction(durable_list: DurableStructure) -> None:
+    durable_list.compact()
+    assert path.getsize(path.join(WAL_FOLDER, DurableStructure.LOG_FILE)) == 0
+
+    durable_list.assign_iterable(ACCOUNTS[:3])
+    durable_list.close()
+    assert recover(WAL_FOLDER).to_list() == list(ACCOUNTS[:3])
+
+
+def test_torn_record(durable_list: DurableStructure) -> None:
+    durable_list.close()
+    with open(path.join(WAL_FOLDER, DurableStructure.LOG_FILE), 'a', encoding='utf-8') as log_file:
+        log_file.write('[11, "add_last", [{"id"')
+
+    recovered = recover(WAL_FOLDER, DynamicList)
+    assert recovered.to_list() == list(ACCOUNTS)
+    recovered.close()
+
+
+def test_queue_and_stack() -> None:
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    with DurableStructure(DynamicQueue(), WAL_FOLDER, fsync_policy='never', compact_every=4) as durable:
+        for account in ACCOUNTS:
+            durable.enqueue(account)
+        assert durable.dequeue() == ACCOUNTS[0]
+    with recover(WAL_FOLDER, DynamicQueue) as recovered:
+        assert list(recovered) == list(ACCOUNTS[1:])
+
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    with DurableStructure(DynamicStack(), WAL_FOLDER, fsync_policy='always', compact_every=4) as durable:
+        for account in ACCOUNTS:
+            durable.push(account)
+        assert durable.pop() == ACCOUNTS[-1]
+    with recover(WAL_FOLDER, DynamicStack) as recovered:
+        assert recovered.peek() == ACCOUNTS[-2]
+        assert list(recovered) == list(reversed(ACCOUNTS[:-1]))
+
+    with raises(InvalidFsyncPolicy):
+        DurableStructure(DynamicQueue(), WAL_FOLDER, fsync_policy='sometimes')
+
+
+def test_every_mutator_is_logged() -> None:
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    with DurableStructure(DynamicQueue(), WAL_FOLDER) as durable:
+        for i in range(5):
+            durable.enqueue(i)
+        assert durable.drain(count=3) == [0, 1, 2]
+    with recover(WAL_FOLDER, DynamicQueue) as recovered:
+        assert list(recovered) == [3, 4]
+
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    with DurableStructure(DynamicList(), WAL_FOLDER) as durable:
+        durable.append(1)
+        durable.extend(i for i in (2, 3))
+        durable.add_last(4)
+        assert durable.pop(0) == 1
+        durable += [5, 6, 7]
+        durable[1:3] = iter(['a', 'b', 'c'])
+        durable[0] = 'z'
+        del durable[::2]
+        expected = durable.to_list()
+    with recover(WAL_FOLDER, DynamicList) as recovered:
+        assert recovered.to_list() == expected == ['a', 'c', 6]
+
+        recovered.loads_json('[1, 2]')
+    with recover(WAL_FOLDER, DynamicList) as recovered:
+        assert recovered.to_list() == [1, 2]
+
+
+def test_failed_operations() -> None:
+    rmtree(WAL_FOLDER, ignore_errors=True)
+    with raises(TypeError):
+        DurableStructure(NumericList(), WAL_FOLDER)
+    with raises(TypeError):
+        DurableStructure(ExpiringQueue(), WAL_FOLDER)
+
+    with DurableStructure(BoundedList(3), WAL_FOLDER) as durable:
+        durable.add_last('a')
+        with raises(TypeError):
+            durable.add_last(object())
+        with raises(FullList):
+            durable.extend(['b', 'c', 'd'])
+        assert durable.to_list() == ['a', 'b', 'c']
+    with recover(WAL_FOLDER, lambda: BoundedList(3)) as recovered:
+        assert recovered.to_list() == ['a', 'b', 'c']